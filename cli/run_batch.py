@@ -15,34 +15,39 @@
 #           on different stocks (steady WMT vs volatile NVDA, etc.).
 
 import argparse
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pandas as pd
-import yaml
 
 # Import our framework modules
 from qb.data import load_csv       # loads price data (OHLCV) into pandas DataFrame
+from qb.config import load_config  # loads strategy settings from YAML (or JSON)
 from qb.strategy import SmaCrossover, BuyAndHold, RSI, BollingerBands, MA200, Momentum, ATRTrailingStop, DonchianChannel  # strategies: SMA crossover, buy & hold, RSI, Bollinger Bands, MA200, Momentum, ATR Trailing Stop, and Donchian Channel
 from qb.backtester import Backtester  # runs the backtest "simulation loop"
 from qb.metrics import equity_stats   # calculates performance metrics (returns, sharpe, etc.)
 
 
-def run_one(ticker: str, config_path: str) -> dict:
+def load_one(ticker: str, refresh_cache: bool = False) -> pd.DataFrame:
     """
-    Run the backtest for a single ticker (like 'GOOGL').
+    Load the historical price data for a single ticker from data/{ticker}.csv.
 
-    Steps:
-      1. Load the strategy settings from the config YAML file.
-      2. Load that stock's historical price data from data/{ticker}.csv.
-      3. Apply the chosen strategy to that data.
-      4. Run the backtest to simulate trades and track account value.
-      5. Calculate summary statistics (return, risk, drawdowns).
-      6. Return those stats as a dictionary.
+    A Parquet copy is cached next to the CSV so repeated runs skip CSV parsing.
     """
-    # Load strategy parameters from YAML (e.g. fast=20, slow=50 for SMA crossover)
-    cfg = yaml.safe_load(open(config_path))
+    return load_csv(f"data/{ticker}.csv", refresh_cache=refresh_cache)
+
 
-    # Load price data for this ticker (expects file like data/GOOGL.csv)
-    df = load_csv(f"data/{ticker}.csv")
+def backtest_one(ticker: str, df: pd.DataFrame, cfg: dict) -> dict:
+    """
+    Backtest a single ticker whose price data is already loaded.
 
+    Steps:
+      1. Apply the strategy described by the (already parsed) config.
+      2. Run the backtest to simulate trades and track account value.
+      3. Calculate summary statistics (return, risk, drawdowns).
+      4. Return those stats as a dictionary.
+    """
     # Build the strategy object with chosen parameters
     strategy_name = cfg.get("name", "sma_crossover")
     if strategy_name == "sma_crossover":
@@ -77,27 +82,135 @@ def run_one(ticker: str, config_path: str) -> dict:
     return stats
 
 
-if __name__ == "__main__":
+def _pool_context():
+    """
+    Start method for the backtest worker pool.
+
+    On Linux, fork lets workers inherit the already-imported pandas/qb modules,
+    including the Numba kernels compiled when qb was imported, instead of
+    re-importing them. Elsewhere we keep the platform default, since fork is
+    unsafe on macOS and unavailable on Windows.
+    """
+    if sys.platform.startswith("linux"):
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool for backtests, using the start method from _pool_context()."""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+
+
+def run_one(ticker: str, cfg: dict, refresh_cache: bool = False) -> dict:
+    """
+    Run the backtest for a single ticker (like 'GOOGL'): load its data, then backtest it.
+
+    The config is parsed once by the caller and passed in, so a batch of
+    many tickers doesn't re-read and re-parse the same YAML file each time.
+    """
+    return backtest_one(ticker, load_one(ticker, refresh_cache), cfg)
+
+
+def run(tickers, config, workers=None, refresh_cache=False, executor=None) -> tuple:
+    """
+    Backtest one strategy config on a list of tickers and save batch_stats_<strategy>.csv.
+
+    This is what the command line runs; other scripts (e.g. run_all_strategies)
+    call it directly so several strategies share one Python process, its
+    imports and its loaded price data.
+
+    Args:
+        tickers: Ticker symbols with data in data/{ticker}.csv
+        config: Path to the strategy config (YAML, or JSON if it ends in .json)
+        workers: Maximum number of worker processes (defaults to one per
+            ticker, capped at CPU count). Ignored when executor is given.
+        refresh_cache: Rebuild the Parquet data cache from the CSV files
+        executor: Optional process pool to run the backtests on, so callers
+            running many configs can reuse one pool instead of starting a new
+            one per config
+
+    Returns:
+        (DataFrame with one row of stats per ticker in the order requested,
+        strategy name from the config, as used in the CSV filename)
+    """
+    # Load strategy parameters once (e.g. fast=20, slow=50 for SMA crossover)
+    cfg = load_config(config)
+
+    # Load all the price data up front with a thread pool: pandas releases
+    # the GIL while parsing, so the reads for different tickers overlap
+    dfs = {}
+    with ThreadPoolExecutor(max_workers=min(len(tickers), 8)) as tpool:
+        futs = {tpool.submit(load_one, t, refresh_cache): t for t in tickers}
+        for f in as_completed(futs):
+            ticker = futs[f]
+            try:
+                dfs[ticker] = f.result()
+            except Exception as e:
+                # One bad ticker (missing CSV, bad data) shouldn't kill the whole batch
+                print(f"Error loading {ticker}: {e}")
+
+    # Run the backtest for each ticker in parallel: every ticker is independent,
+    # so each one gets its own process and the GIL is not a bottleneck
+    results = {}
+    if dfs:
+        if executor is None:
+            workers = workers or min(len(dfs), os.cpu_count() or 1)
+            with process_pool(workers) as ex:
+                results = _backtest_all(ex, dfs, cfg)
+        else:
+            results = _backtest_all(executor, dfs, cfg)
+
+    # Keep the rows in the order the tickers were requested
+    rows = [results[t] for t in tickers if t in results]
+    if not rows:
+        raise RuntimeError("No tickers were backtested successfully")
+
+    # Put all results into a single DataFrame for comparison
+    df = pd.DataFrame(rows)[["ticker", "total_return", "volatility", "sharpe", "max_drawdown"]]
+
+    # Save results to CSV with strategy name in filename
+    strategy_name = cfg.get("name", "unknown")
+    df.to_csv(f"batch_stats_{strategy_name}.csv", index=False)
+    return df, strategy_name
+
+
+def _backtest_all(executor, dfs: dict, cfg: dict) -> dict:
+    """Submit one backtest per ticker to the pool and collect the stats by ticker."""
+    results = {}
+    futs = {executor.submit(backtest_one, t, df, cfg): t for t, df in dfs.items()}
+    for f in as_completed(futs):
+        ticker = futs[f]
+        try:
+            results[ticker] = f.result()
+        except Exception as e:
+            print(f"Error running {ticker}: {e}")
+    return results
+
+
+def main(argv=None):
     # Argument parser so you can run from the command line
     p = argparse.ArgumentParser()
     # Default tickers if you don't pass any: GOOGL, WMT, AMD
     p.add_argument("--tickers", nargs="+", default=["GOOGL", "WMT", "AMD"])
-    # Config file with strategy parameters (YAML)
+    # Config file with strategy parameters (YAML, or JSON if it ends in .json)
     p.add_argument("--config", default="strategies/sma_crossover.yaml")
-    args = p.parse_args()
-
-    # Run the backtest for each ticker the user requested
-    rows = [run_one(t, args.config) for t in args.tickers]
+    # Maximum number of worker processes (defaults to one per ticker, capped at CPU count)
+    p.add_argument("--workers", type=int, default=None)
+    # Rebuild the Parquet data cache from the CSV files
+    p.add_argument("--refresh-cache", action="store_true")
+    args = p.parse_args(argv)
 
-    # Put all results into a single DataFrame for comparison
-    df = pd.DataFrame(rows)[["ticker", "total_return", "volatility", "sharpe", "max_drawdown"]]
+    try:
+        df, strategy_name = run(args.tickers, args.config, args.workers, args.refresh_cache)
+    except RuntimeError as e:
+        raise SystemExit(str(e))
 
     # Print results as a nice table in the terminal
     print("\n=== Batch Backtest Results ===")
     print(df.to_string(index=False))
 
-    # Save results to CSV with strategy name in filename
-    strategy_name = yaml.safe_load(open(args.config)).get("name", "unknown")
-    output_file = f"batch_stats_{strategy_name}.csv"
-    df.to_csv(output_file, index=False)
-    print(f"\nSaved results to {output_file}")
+    print(f"\nSaved results to batch_stats_{strategy_name}.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,7 +73,7 @@ Examples:
             # Modify the strategy comparison to use the specified stock
             import scripts.strategy_comparison as sc
             sc.main = lambda: sc.run_strategy_comparison(args.stock)
-            run_strategy_comparison()
+            run_strategy_comparison([])
             
         elif args.command == 'report':
             print("Generating comprehensive HTML report...")
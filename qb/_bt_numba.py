@@ -0,0 +1,105 @@
+import numpy as np
+from ._njit import njit, precompile, c_arrays, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _simulate_all_in(close, signals, initial_cash):
+    """
+    Simulate all-in/all-out trading, investing all available cash on each buy.
+    
+    Specialization of `_simulate_fractional` for allocate=1.0, the usual
+    configuration: share sizing skips the allocation multiply.
+    
+    Args:
+        close: float64 array of closing prices
+        signals: int8 array with values 1 (buy), -1 (sell), 0 (hold)
+        initial_cash: Starting capital
+        
+    Returns:
+        Tuple of (equity, positions) arrays, one value per bar
+    """
+    n = close.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    positions = np.empty(n, dtype=np.int64)
+    
+    cash = initial_cash
+    shares = 0
+    
+    for i in range(n):
+        signal = signals[i]
+        price = close[i]
+        
+        if signal == 1 and cash > 0:  # Buy signal
+            shares_to_buy = int(cash / price)
+            if shares_to_buy > 0:
+                shares += shares_to_buy
+                cash -= shares_to_buy * price
+                
+        elif signal == -1 and shares > 0:  # Sell signal
+            cash += shares * price
+            shares = 0
+        
+        equity[i] = cash + shares * price
+        positions[i] = shares
+    
+    return equity, positions
+
+
+@njit(cache=True)
+def _simulate_fractional(close, signals, initial_cash, allocate):
+    """
+    Simulate all-in/all-out trading, investing a fraction of cash on each buy.
+    
+    Args:
+        close: float64 array of closing prices
+        signals: int8 array with values 1 (buy), -1 (sell), 0 (hold)
+        initial_cash: Starting capital
+        allocate: Fraction of cash to invest on each buy signal
+        
+    Returns:
+        Tuple of (equity, positions) arrays, one value per bar
+    """
+    n = close.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    positions = np.empty(n, dtype=np.int64)
+    
+    cash = initial_cash
+    shares = 0
+    
+    for i in range(n):
+        signal = signals[i]
+        price = close[i]
+        
+        if signal == 1 and cash > 0:  # Buy signal
+            shares_to_buy = int((cash * allocate) / price)
+            if shares_to_buy > 0:
+                shares += shares_to_buy
+                cash -= shares_to_buy * price
+                
+        elif signal == -1 and shares > 0:  # Sell signal
+            cash += shares * price
+            shares = 0
+        
+        equity[i] = cash + shares * price
+        positions[i] = shares
+    
+    return equity, positions
+
+
+def _precompile_kernels():
+    """
+    Compile the simulation kernels up front for the argument types Backtester uses.
+    
+    Close prices may be writable or read-only (a pandas column view); the
+    signals are always copied into a fresh, writable int8 buffer.
+    """
+    from numba import types
+    f8 = types.float64
+    signals, _ = c_arrays('int8')
+    for close in c_arrays('float64'):
+        precompile(_simulate_all_in, (close, signals, f8))
+        precompile(_simulate_fractional, (close, signals, f8, f8))
+
+
+if NUMBA_AVAILABLE:
+    _precompile_kernels()
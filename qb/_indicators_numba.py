@@ -0,0 +1,338 @@
+import numpy as np
+from ._njit import njit, precompile, c_arrays, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _rsi_wilder(close, period):
+    """
+    RSI with Wilder's smoothing, computed in a single pass.
+    
+    The first average gain/loss is the simple mean of the first `period`
+    price changes; after that each average is updated with
+    avg = (avg * (period - 1) + value) / period.
+    
+    Args:
+        close: float64 array of closing prices
+        period: Lookback period for RSI calculation
+        
+    Returns:
+        float64 array of RSI values (NaN during the warm-up period)
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    if period <= 0 or n <= period:
+        return rsi
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        if i <= period:
+            # Seed the averages with a simple mean of the first period changes
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+        # No gains and no losses: RSI is undefined, leave NaN
+    
+    return rsi
+
+
+@njit(cache=True)
+def _bbands(close, window, num_std):
+    """
+    Bollinger Bands with the rolling mean and standard deviation fused into one pass.
+    
+    The mean and sum of squared deviations are updated incrementally
+    (Welford's method) as prices enter and leave the window, so every price
+    is touched twice in total instead of once per statistic. The standard
+    deviation uses ddof=1 and windows containing NaN produce NaN, matching
+    pandas' rolling().std(). A window of one repeated price has exactly that
+    price as its mean and zero width, rather than whatever rounding residue
+    the running updates have accumulated, so touching a flat band is an
+    exact tie however long the series is.
+    
+    Args:
+        close: float64 array of closing prices
+        window: Moving average window period
+        num_std: Number of standard deviations for bands
+        
+    Returns:
+        Tuple of (middle, upper, lower) float64 arrays
+    """
+    n = close.shape[0]
+    middle = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    
+    count = 0      # non-NaN values currently in the window
+    nan_count = 0  # NaN values currently in the window
+    mean = 0.0
+    m2 = 0.0
+    run = 0        # length of the run of equal prices ending at i
+    
+    for i in range(n):
+        # Add the newest price
+        x = close[i]
+        if np.isnan(x):
+            nan_count += 1
+            run = 0
+        else:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            run = run + 1 if i > 0 and x == close[i - 1] else 1
+        
+        # Drop the price that just left the window
+        if i >= window:
+            y = close[i - window]
+            if np.isnan(y):
+                nan_count -= 1
+            else:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = y - mean
+                    mean -= delta / count
+                    m2 -= delta * (y - mean)
+        
+        if i >= window - 1 and nan_count == 0:
+            if run >= window:
+                # Flat window: exact mean, zero-width bands
+                middle[i] = x
+                upper[i] = x
+                lower[i] = x
+                continue
+            middle[i] = mean
+            if window > 1:
+                sd = np.sqrt(max(m2, 0.0) / (window - 1))
+                upper[i] = mean + num_std * sd
+                lower[i] = mean - num_std * sd
+    
+    return middle, upper, lower
+
+
+@njit(cache=True)
+def _atr_trail_signals(close, ma20, atr, multiplier):
+    """
+    Entry/exit signals for the ATR trailing stop strategy.
+    
+    Enters when the close is above its 20-day average, then tracks the peak
+    close since entry and exits once the close falls to peak - multiplier * ATR.
+    
+    Args:
+        close: float64 array of closing prices
+        ma20: float64 array with the 20-day moving average of close
+        atr: float64 array of Average True Range values
+        multiplier: Stop distance in multiples of ATR
+        
+    Returns:
+        int8 array with values 1 (buy), -1 (sell), 0 (hold)
+    """
+    n = close.shape[0]
+    signals = np.zeros(n, dtype=np.int8)
+    in_position = False
+    peak = 0.0
+    
+    for i in range(1, n):
+        price = close[i]
+        
+        if not in_position:
+            # Simple entry condition: price above its 20-day moving average
+            if price > ma20[i]:
+                signals[i] = 1
+                in_position = True
+                peak = price
+        else:
+            # Update peak price if current price is higher
+            if price > peak:
+                peak = price
+            
+            # Check if the trailing stop is hit
+            if price <= peak - multiplier * atr[i]:
+                signals[i] = -1
+                in_position = False
+    
+    return signals
+
+
+@njit(cache=True)
+def _rolling_mean_step(close, i, window, state):
+    """
+    Advance a rolling mean by one bar and return its value at bar i.
+    
+    Follows the same algorithm as pandas' rolling().mean() so results agree
+    to the last bit: Kahan-compensated running sums for values entering and
+    leaving the window, and a window made of one repeated value returns
+    that value exactly (flat stretches produce exact ties, not rounding noise).
+    
+    Args:
+        close: float64 array of prices
+        i: Current bar
+        window: Window length
+        state: float64 array of 6 running values, initialised by the caller to
+            [0, 0, 0, 0, 0, close[0]]:
+            sum, add compensation, remove compensation, observations,
+            consecutive equal values, previous value
+        
+    Returns:
+        The moving average at bar i, or NaN if the window isn't full or has a NaN
+    """
+    # Drop the price that just left the window
+    if i >= window:
+        y = close[i - window]
+        if not np.isnan(y):
+            state[3] -= 1
+            v = -y - state[2]
+            t = state[0] + v
+            state[2] = t - state[0] - v
+            state[0] = t
+    
+    # Add the newest price
+    x = close[i]
+    if not np.isnan(x):
+        state[3] += 1
+        v = x - state[1]
+        t = state[0] + v
+        state[1] = t - state[0] - v
+        state[0] = t
+        if x == state[5]:
+            state[4] += 1
+        else:
+            state[4] = 1
+        state[5] = x
+    
+    if i < window - 1 or state[3] < window:
+        return np.nan
+    if state[4] >= state[3]:
+        return state[5]
+    return state[0] / state[3]
+
+
+@njit(cache=True)
+def _sma_cross(close, fast, slow):
+    """
+    SMA crossover signals with both moving averages and the crossover test fused.
+    
+    Both averages are updated incrementally (see `_rolling_mean_step`) and
+    today's values are compared with yesterday's in the same pass. Like
+    pandas' rolling mean, a window that contains a NaN has no average and
+    can't produce a crossover.
+    
+    Args:
+        close: float64 array of closing prices
+        fast: Fast moving average period
+        slow: Slow moving average period
+        
+    Returns:
+        int8 array with values 1 (golden cross), -1 (death cross), 0 (hold)
+    """
+    n = close.shape[0]
+    signals = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return signals
+    
+    fast_state = np.zeros(6)
+    slow_state = np.zeros(6)
+    fast_state[5] = close[0]
+    slow_state[5] = close[0]
+    prev_fast = np.nan
+    prev_slow = np.nan
+    
+    for i in range(n):
+        cur_fast = _rolling_mean_step(close, i, fast, fast_state)
+        cur_slow = _rolling_mean_step(close, i, slow, slow_state)
+        
+        # Golden cross: fast MA crosses above slow MA
+        if cur_fast > cur_slow and prev_fast <= prev_slow:
+            signals[i] = 1
+        # Death cross: fast MA crosses below slow MA
+        elif cur_fast < cur_slow and prev_fast >= prev_slow:
+            signals[i] = -1
+        
+        prev_fast = cur_fast
+        prev_slow = cur_slow
+    
+    return signals
+
+
+@njit(cache=True)
+def _atr(high, low, close, window):
+    """
+    Average True Range with the true range and its moving average fused.
+    
+    Each bar's true range, max(high - low, |high - prev close|, |low - prev close|),
+    is computed and fed straight into the rolling mean (see
+    `_rolling_mean_step`), so there are no intermediate arrays beyond the
+    true range itself. The first bar has no previous close and its true
+    range is NaN, as with pandas' shift-based calculation.
+    
+    Args:
+        high: float64 array of high prices
+        low: float64 array of low prices
+        close: float64 array of closing prices
+        window: Lookback period for the moving average
+        
+    Returns:
+        float64 array of ATR values (NaN until a full window is available)
+    """
+    n = close.shape[0]
+    tr = np.empty(n)
+    atr = np.empty(n)
+    if n == 0:
+        return atr
+    
+    state = np.zeros(6)
+    state[5] = np.nan
+    
+    for i in range(n):
+        if i == 0:
+            tr[i] = np.nan
+        else:
+            hl = high[i] - low[i]
+            hc = abs(high[i] - close[i - 1])
+            lc = abs(low[i] - close[i - 1])
+            if np.isnan(hl) or np.isnan(hc) or np.isnan(lc):
+                tr[i] = np.nan
+            else:
+                tr[i] = max(hl, hc, lc)
+        atr[i] = _rolling_mean_step(tr, i, window, state)
+    
+    return atr
+
+
+def _precompile_kernels():
+    """
+    Compile the kernels up front for the argument types the strategies use.
+    
+    Runs at import, so the first backtest in a process doesn't pay for
+    compilation (after the first run it only loads Numba's cache). Price
+    arrays are float64, either all writable or all read-only; other
+    combinations still work, they just compile on first use.
+    """
+    from numba import types
+    i8, f8 = types.int64, types.float64
+    for arr in c_arrays('float64'):
+        precompile(_rsi_wilder, (arr, i8))
+        precompile(_bbands, (arr, i8, f8))
+        precompile(_atr_trail_signals, (arr, arr, arr, f8))
+        precompile(_sma_cross, (arr, i8, i8))
+        precompile(_atr, (arr, arr, arr, i8))
+
+
+if NUMBA_AVAILABLE:
+    _precompile_kernels()
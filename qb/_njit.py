@@ -0,0 +1,53 @@
+# Optional Numba support.
+# If numba is installed, `njit` compiles the decorated function to native code.
+# Otherwise it is a no-op decorator and the function runs as plain Python.
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for numba.njit that returns the function unchanged.
+        
+        Supports both the bare `@njit` and the `@njit(cache=True)` forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+
+
+def precompile(func, *signatures):
+    """
+    Compile a kernel for the given argument types right away.
+    
+    With cache=True the machine code is loaded from Numba's on-disk cache
+    when it is there, so this is cheap after the first run. Unlike passing
+    signatures to @njit, the kernel still compiles lazily for any other
+    argument types instead of rejecting them. No-op without Numba.
+    
+    Args:
+        func: A function decorated with njit
+        signatures: Tuples of Numba argument types
+    """
+    if NUMBA_AVAILABLE:
+        for signature in signatures:
+            func.compile(signature)
+
+def c_arrays(dtype):
+    """
+    The 1-D C-contiguous array types for dtype: (writable, read-only).
+    
+    Numba treats read-only arrays (what pandas hands out for DataFrame
+    columns) as a different type from writable ones, so a kernel called
+    with both needs both compiled.
+    """
+    from numba import types
+    dtype = getattr(types, dtype)
+    return types.Array(dtype, 1, 'C'), types.Array(dtype, 1, 'C', readonly=True)
@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
+from functools import partial
 from typing import Dict, Any
 from .strategy import Strategy
+from ._bt_numba import _simulate_all_in, _simulate_fractional
 
 class Backtester:
     """
@@ -21,48 +23,37 @@ class Backtester:
         self.strategy = strategy
         self.initial_cash = initial_cash
         
+        # Pick the simulation kernel once: allocate=1.0 (the common case)
+        # gets a specialized loop without the allocation multiply
+        self._alloc = float(strategy.allocate)
+        if self._alloc == 1.0:
+            self._run_fn = _simulate_all_in
+        else:
+            self._run_fn = partial(_simulate_fractional, allocate=self._alloc)
+        
     def run(self) -> Dict[str, pd.Series]:
         """
         Run the backtest simulation.
         
+        The bar-by-bar loop lives in `qb._bt_numba`, which is compiled with
+        Numba when it is installed and runs as plain Python otherwise.
+        
         Returns:
             Dictionary with 'equity' and 'positions' series
         """
         # Generate trading signals
-        signals = self.strategy.generate_signals(self.data)
-        
-        # Initialize tracking variables
-        cash = self.initial_cash
-        shares = 0
-        equity = []
-        positions = []
+        close = np.ascontiguousarray(self.data['Close'].to_numpy(dtype=np.float64))
+        n = len(close)
+        raw_signals = np.asarray(self.strategy.generate_signals(self.data))[:n]
+        signals = np.zeros(n, dtype=np.int8)
+        signals[:len(raw_signals)] = raw_signals
         
         # Simulate trading day by day
-        for i, (date, row) in enumerate(self.data.iterrows()):
-            signal = signals.iloc[i] if i < len(signals) else 0
-            price = row['Close']
-            
-            # Execute trades based on signals
-            if signal == 1 and cash > 0:  # Buy signal
-                # Calculate how many shares to buy
-                shares_to_buy = int((cash * self.strategy.allocate) / price)
-                if shares_to_buy > 0:
-                    shares += shares_to_buy
-                    cash -= shares_to_buy * price
-                    
-            elif signal == -1 and shares > 0:  # Sell signal
-                # Sell all shares
-                cash += shares * price
-                shares = 0
-            
-            # Calculate current portfolio value
-            current_equity = cash + (shares * price)
-            equity.append(current_equity)
-            positions.append(shares)
+        equity, positions = self._run_fn(close, signals, float(self.initial_cash))
         
-        # Create result series
-        equity_series = pd.Series(equity, index=self.data.index)
-        positions_series = pd.Series(positions, index=self.data.index)
+        # Create result series (the arrays are freshly allocated, so wrap them without copying)
+        equity_series = pd.Series(equity, index=self.data.index, copy=False)
+        positions_series = pd.Series(positions, index=self.data.index, copy=False)
         
         return {
             'equity': equity_series,
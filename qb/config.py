@@ -0,0 +1,49 @@
+import copy
+import json
+import os
+from functools import lru_cache
+import yaml
+
+# libyaml's C loader is much faster than the pure-Python one, when it's built in
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+def load_config(path: str) -> dict:
+    """
+    Load a strategy configuration file.
+    
+    Files ending in .json are parsed as JSON (with orjson when it is
+    installed); anything else is parsed as YAML with the C-accelerated
+    safe loader when available.
+    
+    Within a process, parsed configs are kept in memory (keyed on the path
+    and the file's modification time and size), so loading the same config
+    again, e.g. once per ticker or per run in a sweep, doesn't re-read and
+    re-parse it. Each call returns its own copy, so callers may modify it.
+    
+    Args:
+        path: Path to a .yaml/.yml or .json config file
+        
+    Returns:
+        Parsed configuration dictionary
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_load_config_cached(path, st.st_mtime_ns, st.st_size))
+
+@lru_cache(maxsize=64)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """In-memory cache for load_config; mtime and size in the key invalidate edited files."""
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
@@ -1,23 +1,96 @@
+import os
+import tempfile
+from functools import lru_cache
 import pandas as pd
 from typing import Optional
 
-def load_csv(filepath: str) -> pd.DataFrame:
+def _parquet_path(filepath: str) -> str:
+    """Path of the Parquet cache that sits next to a CSV file."""
+    return os.path.splitext(filepath)[0] + '.parquet'
+
+def _read_cache(filepath: str) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet cache for a CSV file if it is up to date.
+    
+    Returns None when there is no cache, it is older than the CSV,
+    or Parquet support (pyarrow) is not installed. Without a CSV, the
+    Parquet file (e.g. written by fetch_data.py --format parquet) is the data.
+    """
+    cache_path = _parquet_path(filepath)
+    if not os.path.exists(cache_path):
+        return None
+    if os.path.exists(filepath) and os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except (ImportError, OSError, ValueError):
+        return None
+
+def _write_cache(df: pd.DataFrame, filepath: str) -> None:
+    """Write the cleaned DataFrame to its Parquet cache, skipping silently on failure."""
+    cache_path = _parquet_path(filepath)
+    tmp_path = None
+    try:
+        # A temp file of its own per call: threads loading the same ticker
+        # at once (the loader pools in cli/run_batch) share a process id
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.', suffix='.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        # Atomic rename so concurrent readers never see a half-written file
+        os.replace(tmp_path, cache_path)
+    except (ImportError, OSError, ValueError):
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_csv(filepath: str, refresh_cache: bool = False) -> pd.DataFrame:
     """
     Load price data from CSV file.
     
     Expected columns: Date, Open, High, Low, Close, Volume
     Returns DataFrame with Date as index and OHLCV columns.
+    
+    The cleaned data is cached next to the CSV as a Parquet file
+    (e.g. data/GOOGL.parquet) when pyarrow is available. Later loads read
+    the cache instead of re-parsing the CSV, as long as the CSV hasn't
+    been modified since. Pass refresh_cache=True to rebuild it. If only the
+    Parquet file exists (fetch_data.py --format parquet), it is loaded directly.
+    
+    Within a process, loaded frames are also kept in memory (keyed on the
+    path and the CSV's modification time), so running several strategies
+    on the same ticker parses it only once. Each call returns a shallow
+    copy: adding columns is safe, but the price values themselves are
+    shared and should be treated as read-only.
     """
-    df = pd.read_csv(filepath)
+    if refresh_cache:
+        df = _load_csv_uncached(filepath, refresh_cache=True)
+    else:
+        source = filepath
+        if not os.path.exists(filepath) and os.path.exists(_parquet_path(filepath)):
+            source = _parquet_path(filepath)
+        df = _load_csv_cached(filepath, os.path.getmtime(source))
+    return df.copy(deep=False)
+
+@lru_cache(maxsize=32)
+def _load_csv_cached(filepath: str, mtime: float) -> pd.DataFrame:
+    """In-memory cache for load_csv; mtime in the key invalidates edited files."""
+    return _load_csv_uncached(filepath)
+
+def _load_csv_uncached(filepath: str, refresh_cache: bool = False) -> pd.DataFrame:
+    """Read a CSV (or its Parquet cache) and clean it into an OHLCV DataFrame."""
+    if not refresh_cache or not os.path.exists(filepath):
+        cached = _read_cache(filepath)
+        if cached is not None:
+            return cached
     
-    # Remove any rows that have non-numeric values in the first column (like ticker symbols)
-    df = df[df.iloc[:, 0].str.match(r'^\d{4}-\d{2}-\d{2}', na=False)]
+    df = pd.read_csv(filepath)
     
-    # Convert Date column to datetime
-    df['Date'] = pd.to_datetime(df['Date'])
+    # Parse dates in one vectorized pass; rows whose first column isn't a
+    # YYYY-MM-DD date (like the ticker symbol row) become NaT and are dropped
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', exact=False, errors='coerce')
+    df = df.dropna(subset=['Date'])
     
     # Set Date as index
-    df.set_index('Date', inplace=True)
+    df = df.set_index('Date')
     
     # Ensure we have the required columns
     required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
@@ -26,8 +99,7 @@ def load_csv(filepath: str) -> pd.DataFrame:
         raise ValueError(f"Missing required columns: {missing_cols}")
     
     # Convert numeric columns to float
-    for col in required_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df[required_cols] = df[required_cols].apply(pd.to_numeric, errors='coerce')
     
     # Remove any rows with NaN values
     df = df.dropna()
@@ -35,4 +107,6 @@ def load_csv(filepath: str) -> pd.DataFrame:
     # Sort by date to ensure chronological order
     df.sort_index(inplace=True)
     
+    _write_cache(df, filepath)
+    
     return df
@@ -20,14 +20,18 @@ def equity_stats(equity: pd.Series) -> Dict[str, float]:
             'max_drawdown': 0.0
         }
     
-    # Calculate returns
-    returns = equity.pct_change().dropna()
+    eq = equity.to_numpy(dtype=np.float64)
+    
+    # Calculate returns (skipping NaNs, like pct_change().dropna())
+    returns = np.diff(eq) / eq[:-1]
+    returns = returns[~np.isnan(returns)]
     
     # Total return
-    total_return = (equity.iloc[-1] / equity.iloc[0]) - 1
+    total_return = (eq[-1] / eq[0]) - 1
     
     # Annualized volatility (assuming daily data)
-    volatility = returns.std() * np.sqrt(252)  # 252 trading days per year
+    std = returns.std(ddof=1) if len(returns) > 1 else np.nan
+    volatility = std * np.sqrt(252)  # 252 trading days per year
     
     # Sharpe ratio (assuming risk-free rate of 0)
     if volatility > 0:
@@ -35,10 +39,9 @@ def equity_stats(equity: pd.Series) -> Dict[str, float]:
     else:
         sharpe = 0.0
     
-    # Maximum drawdown
-    rolling_max = equity.expanding().max()
-    drawdown = (equity - rolling_max) / rolling_max
-    max_drawdown = drawdown.min()
+    # Maximum drawdown from the running peak, in a single ufunc pass
+    peak = np.maximum.accumulate(eq)
+    max_drawdown = ((eq - peak) / peak).min()
     
     return {
         'total_return': total_return,
@@ -1,18 +1,257 @@
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple
+from ._njit import NUMBA_AVAILABLE
+from ._indicators_numba import _rsi_wilder, _bbands, _atr_trail_signals, _sma_cross, _atr
+
+# bottleneck's moving-window min/max are much faster than pandas rolling;
+# fall back to pandas when it isn't installed
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - optional dependency
+    bn = None
+
+def _rolling_means(values: np.ndarray, *windows: int) -> list:
+    """
+    Simple moving averages for several window lengths from one cumulative sum.
+    
+    Each window sum is the difference of two cumulative sums, so all the
+    averages share a single pass over the data. Like pandas' rolling mean,
+    a window that contains a NaN (or isn't full yet) yields NaN.
+    
+    Args:
+        values: Price array, or a 2D (bars, tickers) matrix averaged down each column
+        windows: One or more window lengths
+        
+    Returns:
+        List of moving average arrays (same shape as values), one per window
+    """
+    values = np.asarray(values, dtype=np.float64)
+    nan = np.isnan(values)
+    zeros = np.zeros((1,) + values.shape[1:])
+    csum = np.concatenate((zeros, np.cumsum(np.where(nan, 0.0, values), axis=0)))
+    ncount = np.concatenate((zeros, np.cumsum(nan, axis=0))) if nan.any() else None
+    
+    # Length of the run of equal values ending at each bar. As in pandas, a
+    # window holding one repeated value averages to exactly that value, so
+    # flat stretches give exact ties instead of cumsum rounding noise
+    idx = np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1))
+    same = np.concatenate((zeros.astype(bool), values[1:] == values[:-1]))
+    run = idx - np.maximum.accumulate(np.where(same, 0, idx), axis=0) + 1
+    
+    means = []
+    for window in windows:
+        out = np.full(values.shape, np.nan)
+        if window <= len(values):
+            out[window - 1:] = (csum[window:] - csum[:-window]) / window
+            flat = run >= window
+            out[flat] = values[flat]
+            if ncount is not None:
+                out[window - 1:][ncount[window:] - ncount[:-window] > 0] = np.nan
+        means.append(out)
+    return means
+
+def _crossovers(a: np.ndarray, b) -> tuple:
+    """
+    Find the bars where series `a` crosses series (or level) `b`.
+    
+    Compares each bar with the previous one using array slices instead of
+    Series.shift. NaNs never count as a crossover, and the first bar can't
+    be one since it has no previous value.
+    
+    Args:
+        a: Indicator array
+        b: Array of the same length, or a scalar level
+        
+    Returns:
+        Tuple of boolean arrays (up, down):
+            up: a > b now and a <= b on the previous bar
+            down: a < b now and a >= b on the previous bar
+    """
+    a = np.asarray(a)
+    b = np.broadcast_to(b, a.shape)
+    up = np.zeros(a.shape, dtype=bool)
+    down = np.zeros(a.shape, dtype=bool)
+    # Combine straight into the output slices to skip a temporary per mask
+    np.logical_and(a[1:] > b[1:], a[:-1] <= b[:-1], out=up[1:])
+    np.logical_and(a[1:] < b[1:], a[:-1] >= b[:-1], out=down[1:])
+    return up, down
+
+def _atr_trail_signals_np(close: np.ndarray, ma20: np.ndarray, atr: np.ndarray,
+                          multiplier: float) -> np.ndarray:
+    """
+    NumPy version of the ATR trailing stop kernel, used when Numba is missing.
+    
+    Instead of stepping through every bar in Python, it loops over trades:
+    the next entry is looked up among the precomputed entry candidates, and
+    the exit is found by scanning forward with np.maximum.accumulate for the
+    running peak. The scan grows in doubling blocks so a short trade doesn't
+    pay for a pass over the rest of the series.
+    
+    Args:
+        close: Closing prices
+        ma20: 20-day moving average of close
+        atr: Average True Range values
+        multiplier: Stop distance in multiples of ATR
+        
+    Returns:
+        int8 array with values 1 (buy), -1 (sell), 0 (hold)
+    """
+    n = len(close)
+    signals = np.zeros(n, dtype=np.int8)
+    
+    # Bars where we would enter if flat (the first bar is never traded)
+    entries = np.flatnonzero(close > ma20)
+    entries = entries[entries >= 1]
+    
+    start = 1
+    while True:
+        k = np.searchsorted(entries, start)
+        if k == len(entries):
+            break
+        entry = entries[k]
+        signals[entry] = 1
+        
+        # Scan forward from the bar after entry for the first stop hit
+        peak = close[entry]
+        lo, block = entry + 1, 64
+        exit_bar = -1
+        while lo < n:
+            hi = min(lo + block, n)
+            prices = close[lo:hi]
+            
+            # Running peak and stop level, updated in place to avoid temporaries
+            peaks = np.maximum.accumulate(prices)
+            np.maximum(peaks, peak, out=peaks)
+            stops = np.multiply(atr[lo:hi], -multiplier)
+            stops += peaks
+            
+            hit = prices <= stops
+            if hit.any():
+                exit_bar = lo + int(np.argmax(hit))
+                break
+            peak = peaks[-1]
+            lo, block = hi, block * 2
+        
+        if exit_bar < 0:
+            break
+        signals[exit_bar] = -1
+        start = exit_bar + 1
+    
+    return signals
+
+def _sma(close: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average of a price array."""
+    return pd.Series(close, copy=False).rolling(window=window, min_periods=window).mean().to_numpy()
+
+def _to_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    Build the int8 signal array from buy and sell masks in one pass.
+    
+    A bar flagged as both a buy and a sell is a sell, as it was when the
+    sell mask was written over the buy mask.
+    """
+    return np.where(sell, np.int8(-1), np.where(buy, np.int8(1), np.int8(0)))
+
+def batch_sma_signals(close_matrix: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    """
+    SMA crossover signals for many tickers at once.
+    
+    The close prices of all tickers are stacked as columns of one matrix,
+    so the moving averages and crossover tests run as whole-matrix NumPy
+    operations instead of once per ticker. Results match SmaCrossover's
+    NumPy path run on each column separately.
+    
+    Args:
+        close_matrix: (bars, tickers) array of closing prices on a shared date index
+        fast: Fast moving average period
+        slow: Slow moving average period
+        
+    Returns:
+        int8 array of the same shape with values 1 (buy), -1 (sell), 0 (hold)
+    """
+    fast_ma, slow_ma = _rolling_means(close_matrix, fast, slow)
+    golden_cross, death_cross = _crossovers(fast_ma, slow_ma)
+    return _to_signals(golden_cross, death_cross)
+
+def _polars():
+    """
+    Import polars for the generate_signals_pl fast path.
+    
+    It's optional and slow to import, so it's only loaded on first use.
+    """
+    try:
+        import polars
+    except ImportError:
+        raise ImportError("generate_signals_pl requires polars (pip install polars)") from None
+    return polars
+
+def _pl_crossovers(a, b) -> tuple:
+    """
+    Polars version of `_crossovers`: expressions for a crossing above/below b.
+    
+    Args:
+        a: Indicator expression
+        b: Expression, or a scalar level
+        
+    Returns:
+        Tuple of boolean expressions (up, down)
+    """
+    a_prev = a.shift(1)
+    b_prev = b.shift(1) if isinstance(b, _polars().Expr) else b
+    return (a > b) & (a_prev <= b_prev), (a < b) & (a_prev >= b_prev)
+
+def _pl_signals(df: "pl.DataFrame", buy, sell) -> "pl.Series":
+    """
+    Evaluate buy/sell expressions on a Polars frame into an int8 signal Series.
+    
+    Rolling windows are null until full, and null comparisons count as
+    False, like NaN comparisons on the pandas path. A bar flagged as both
+    is a sell, as in `_to_signals`.
+    """
+    pl = _polars()
+    return df.select(
+        pl.when(sell.fill_null(False)).then(-1)
+        .when(buy.fill_null(False)).then(1)
+        .otherwise(0)
+        .cast(pl.Int8)
+        .alias('signal')
+    ).to_series()
+
+class Bands(NamedTuple):
+    """Indicator bands as plain arrays aligned with the input prices."""
+    middle: np.ndarray
+    upper: np.ndarray
+    lower: np.ndarray
 
 class Strategy(ABC):
     """Base class for all trading strategies."""
     
+    PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+    
+    def _prepare(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make sure the price columns are float64 before indicators run on them.
+        
+        Data from load_csv already is, and is returned untouched. Columns of
+        another dtype (e.g. object columns from a hand-made frame) are
+        converted once here, so the array code and Numba kernels always see
+        plain float64 values instead of boxed Python objects.
+        """
+        convert = {
+            col: np.float64 for col in self.PRICE_COLUMNS
+            if col in data.columns and data[col].dtype != np.float64
+        }
+        return data.astype(convert) if convert else data
+    
     @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate trading signals from price data.
         
         Returns:
-            pd.Series with values: 1 (buy), -1 (sell), 0 (hold)
+            int8 pd.Series with values: 1 (buy), -1 (sell), 0 (hold)
         """
         pass
 
@@ -52,22 +291,58 @@ class SmaCrossover(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
-        # Calculate moving averages
-        fast_ma = data['Close'].rolling(window=self.fast).mean()
-        slow_ma = data['Close'].rolling(window=self.slow).mean()
+        data = self._prepare(data)
         
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
+        close = np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64))
+        
+        # With Numba, moving averages and crossover detection run as one fused pass
+        if NUMBA_AVAILABLE:
+            signals = _sma_cross(close, self.fast, self.slow)
+            return pd.Series(signals, index=data.index, copy=False)
+        
+        # Calculate both moving averages from one shared cumulative sum
+        fast_ma, slow_ma = _rolling_means(close, self.fast, self.slow)
         
         # Golden cross: fast MA crosses above slow MA
-        golden_cross = (fast_ma > slow_ma) & (fast_ma.shift(1) <= slow_ma.shift(1))
-        signals[golden_cross] = 1
+        # Death cross: fast MA crosses below slow MA
+        golden_cross, death_cross = _crossovers(fast_ma, slow_ma)
         
-        # Death cross: fast MA crosses below slow MA  
-        death_cross = (fast_ma < slow_ma) & (fast_ma.shift(1) >= slow_ma.shift(1))
-        signals[death_cross] = -1
+        # Generate signals (int8 is plenty for -1/0/1)
+        signals = _to_signals(golden_cross, death_cross)
         
-        return signals
+        return pd.Series(signals, index=data.index, copy=False)
+    
+    def generate_signals_matrix(self, close: np.ndarray) -> np.ndarray:
+        """
+        Generate signals for several tickers at once (see batch_sma_signals).
+        
+        Args:
+            close: (bars, tickers) array of closing prices
+            
+        Returns:
+            int8 array of the same shape: 1 (buy), -1 (sell), 0 (hold)
+        """
+        return batch_sma_signals(close, self.fast, self.slow)
+    
+    def generate_signals_pl(self, data: "pl.DataFrame") -> "pl.Series":
+        """
+        Generate the same signals as generate_signals from a Polars DataFrame.
+        
+        Moving averages and crossovers are Polars expressions evaluated in
+        one query, without converting to pandas. Requires polars.
+        
+        Args:
+            data: Polars DataFrame with a 'Close' column, in date order
+            
+        Returns:
+            int8 Polars Series with signals: 1 (buy), -1 (sell), 0 (hold)
+        """
+        pl = _polars()
+        close = pl.col('Close').cast(pl.Float64)
+        golden_cross, death_cross = _pl_crossovers(
+            close.rolling_mean(self.fast), close.rolling_mean(self.slow)
+        )
+        return _pl_signals(data, golden_cross, death_cross)
 
 class BuyAndHold(Strategy):
     """
@@ -100,13 +375,13 @@ class BuyAndHold(Strategy):
             Series with signals: 1 (buy once), 0 (hold)
         """
         # Generate signals
-        signals = pd.Series(0, index=data.index)
+        signals = np.zeros(len(data), dtype=np.int8)
         
         # Buy signal only on the first day
         if len(signals) > 0:
-            signals.iloc[0] = 1
+            signals[0] = 1
         
-        return signals
+        return pd.Series(signals, index=data.index, copy=False)
 
 class RSI(Strategy):
     """
@@ -138,7 +413,7 @@ class RSI(Strategy):
     
     def calculate_rsi(self, data: pd.Series, period: int = 14) -> pd.Series:
         """
-        Calculate RSI (Relative Strength Index).
+        Calculate RSI (Relative Strength Index) using Wilder's smoothing.
         
         Args:
             data: Price series (typically Close prices)
@@ -147,22 +422,8 @@ class RSI(Strategy):
         Returns:
             RSI values between 0 and 100
         """
-        # Calculate price changes
-        delta = data.diff()
-        
-        # Separate gains and losses
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
-        
-        # Calculate average gains and losses
-        avg_gains = gains.rolling(window=period).mean()
-        avg_losses = losses.rolling(window=period).mean()
-        
-        # Calculate RS and RSI
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        close = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        return pd.Series(_rsi_wilder(close, period), index=data.index, copy=False)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -174,21 +435,23 @@ class RSI(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate RSI
         rsi = self.calculate_rsi(data['Close'], self.period)
         
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
+        rsi = rsi.to_numpy()
         
         # Buy signal: RSI crosses below lower threshold (oversold)
-        oversold = (rsi < self.lower) & (rsi.shift(1) >= self.lower)
-        signals[oversold] = 1
+        _, oversold = _crossovers(rsi, self.lower)
         
         # Sell signal: RSI crosses above upper threshold (overbought)
-        overbought = (rsi > self.upper) & (rsi.shift(1) <= self.upper)
-        signals[overbought] = -1
+        overbought, _ = _crossovers(rsi, self.upper)
         
-        return signals
+        # Generate signals
+        signals = _to_signals(oversold, overbought)
+        
+        return pd.Series(signals, index=data.index, copy=False)
 
 class MA200(Strategy):
     """
@@ -228,8 +491,11 @@ class MA200(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate 200-day moving average
-        ma200 = data['Close'].rolling(window=self.window).mean()
+        close = data['Close'].to_numpy()
+        ma200 = _sma(close, self.window)
         
         # Apply buffer if specified
         if self.buffer_pct > 0:
@@ -240,18 +506,54 @@ class MA200(Strategy):
             upper_threshold = ma200
             lower_threshold = ma200
         
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
-        
         # Buy signal: price crosses above MA200 (with buffer)
-        buy_signal = (data['Close'] > upper_threshold) & (data['Close'].shift(1) <= upper_threshold.shift(1))
-        signals[buy_signal] = 1
+        buy_signal, _ = _crossovers(close, upper_threshold)
         
         # Sell signal: price crosses below MA200 (with buffer)
-        sell_signal = (data['Close'] < lower_threshold) & (data['Close'].shift(1) >= lower_threshold.shift(1))
-        signals[sell_signal] = -1
+        _, sell_signal = _crossovers(close, lower_threshold)
+        
+        # Generate signals
+        signals = _to_signals(buy_signal, sell_signal)
+        
+        return pd.Series(signals, index=data.index, copy=False)
+    
+    def generate_signals_matrix(self, close: np.ndarray) -> np.ndarray:
+        """
+        Generate signals for several tickers at once.
+        
+        Each column of close is one ticker; the moving averages and crossover
+        tests run over the whole matrix in single NumPy operations.
+        
+        Args:
+            close: (bars, tickers) array of closing prices
+            
+        Returns:
+            int8 array of the same shape: 1 (buy), -1 (sell), 0 (hold)
+        """
+        close = np.asarray(close, dtype=np.float64)
+        (ma200,) = _rolling_means(close, self.window)
+        buffer = ma200 * self.buffer_pct
+        buy_signal, _ = _crossovers(close, ma200 + buffer)
+        _, sell_signal = _crossovers(close, ma200 - buffer)
+        return _to_signals(buy_signal, sell_signal)
+    
+    def generate_signals_pl(self, data: "pl.DataFrame") -> "pl.Series":
+        """
+        Generate the same signals as generate_signals from a Polars DataFrame.
         
-        return signals
+        Args:
+            data: Polars DataFrame with a 'Close' column, in date order
+            
+        Returns:
+            int8 Polars Series with signals: 1 (buy), -1 (sell), 0 (hold)
+        """
+        pl = _polars()
+        close = pl.col('Close').cast(pl.Float64)
+        ma200 = close.rolling_mean(self.window)
+        buffer = ma200 * self.buffer_pct
+        buy_signal, _ = _pl_crossovers(close, ma200 + buffer)
+        _, sell_signal = _pl_crossovers(close, ma200 - buffer)
+        return _pl_signals(data, buy_signal, sell_signal)
 
 class Momentum(Strategy):
     """
@@ -289,9 +591,14 @@ class Momentum(Strategy):
         Returns:
             Momentum values (can be positive or negative)
         """
-        # Calculate momentum as (current_price - price_lookback_periods_ago) / price_lookback_periods_ago
-        momentum = (data - data.shift(lookback)) / data.shift(lookback)
-        return momentum
+        # Calculate momentum as (current_price - price_lookback_periods_ago) / price_lookback_periods_ago,
+        # comparing array slices instead of allocating a shifted Series
+        prices = data.to_numpy(dtype=np.float64)
+        momentum = np.full(len(prices), np.nan)
+        if lookback < len(prices):
+            past = prices[:-lookback]
+            momentum[lookback:] = (prices[lookback:] - past) / past
+        return pd.Series(momentum, index=data.index, copy=False)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -303,21 +610,56 @@ class Momentum(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate momentum
         momentum = self.calculate_momentum(data['Close'], self.lookback)
         
+        # Buy signal: momentum becomes positive (stock starts going up)
+        # Sell signal: momentum becomes negative (stock starts going down)
+        buy_signal, sell_signal = _crossovers(momentum.to_numpy(), 0.0)
+        
         # Generate signals
-        signals = pd.Series(0, index=data.index)
+        signals = _to_signals(buy_signal, sell_signal)
         
-        # Buy signal: momentum becomes positive (stock starts going up)
-        buy_signal = (momentum > 0) & (momentum.shift(1) <= 0)
-        signals[buy_signal] = 1
+        return pd.Series(signals, index=data.index, copy=False)
+    
+    def generate_signals_matrix(self, close: np.ndarray) -> np.ndarray:
+        """
+        Generate signals for several tickers at once.
         
-        # Sell signal: momentum becomes negative (stock starts going down)
-        sell_signal = (momentum < 0) & (momentum.shift(1) >= 0)
-        signals[sell_signal] = -1
+        Each column of close is one ticker; momentum and its zero crossings
+        are computed over the whole matrix in single NumPy operations.
         
-        return signals
+        Args:
+            close: (bars, tickers) array of closing prices
+            
+        Returns:
+            int8 array of the same shape: 1 (buy), -1 (sell), 0 (hold)
+        """
+        close = np.asarray(close, dtype=np.float64)
+        momentum = np.full(close.shape, np.nan)
+        if self.lookback < len(close):
+            past = close[:-self.lookback]
+            momentum[self.lookback:] = (close[self.lookback:] - past) / past
+        buy_signal, sell_signal = _crossovers(momentum, 0.0)
+        return _to_signals(buy_signal, sell_signal)
+    
+    def generate_signals_pl(self, data: "pl.DataFrame") -> "pl.Series":
+        """
+        Generate the same signals as generate_signals from a Polars DataFrame.
+        
+        Args:
+            data: Polars DataFrame with a 'Close' column, in date order
+            
+        Returns:
+            int8 Polars Series with signals: 1 (buy), -1 (sell), 0 (hold)
+        """
+        pl = _polars()
+        close = pl.col('Close').cast(pl.Float64)
+        past = close.shift(self.lookback)
+        buy_signal, sell_signal = _pl_crossovers((close - past) / past, 0.0)
+        return _pl_signals(data, buy_signal, sell_signal)
 
 class ATRTrailingStop(Strategy):
     """
@@ -358,18 +700,31 @@ class ATRTrailingStop(Strategy):
         Returns:
             ATR values
         """
-        # Calculate True Range
-        high_low = data['High'] - data['Low']
-        high_close = np.abs(data['High'] - data['Close'].shift(1))
-        low_close = np.abs(data['Low'] - data['Close'].shift(1))
+        prices = (data['High'].to_numpy(), data['Low'].to_numpy(), data['Close'].to_numpy())
         
-        # True Range is the maximum of these three values
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
+        # True range and its moving average in one compiled pass
+        if NUMBA_AVAILABLE:
+            high, low, close = (np.ascontiguousarray(p, dtype=np.float64) for p in prices)
+            return pd.Series(_atr(high, low, close, window), index=data.index, copy=False)
         
-        # Calculate ATR as the rolling mean of True Range
-        atr = true_range.rolling(window=window).mean()
+        high, low, close = (np.asarray(p, dtype=np.float64) for p in prices)
+        
+        # Calculate True Range; the first bar has no previous close
+        true_range = high - low
+        true_range[:1] = np.nan
+        high_close = np.subtract(high[1:], close[:-1])
+        np.abs(high_close, out=high_close)
+        low_close = np.subtract(low[1:], close[:-1])
+        np.abs(low_close, out=low_close)
+        
+        # True Range is the maximum of these three values (NaN-propagating,
+        # combined in place to avoid temporaries)
+        np.maximum(high_close, low_close, out=high_close)
+        np.maximum(true_range[1:], high_close, out=true_range[1:])
         
-        return atr
+        # Calculate ATR as the rolling mean of True Range
+        atr = pd.Series(true_range, copy=False).rolling(window=window, min_periods=window).mean()
+        return pd.Series(atr.to_numpy(), index=data.index, copy=False)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -381,46 +736,25 @@ class ATRTrailingStop(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate ATR
         atr = self.calculate_atr(data, self.window)
         
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
+        close = np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64))
+        atr = np.ascontiguousarray(atr.to_numpy(dtype=np.float64))
         
-        # Track the highest price since entry (peak)
-        peak_price = data['Close'].copy()
-        in_position = False
-        entry_price = 0
+        # Simple entry condition: price above its 20-day moving average
+        ma20 = np.ascontiguousarray(_sma(close, 20), dtype=np.float64)
         
-        for i in range(1, len(data)):
-            current_price = data['Close'].iloc[i]
-            current_atr = atr.iloc[i]
-            
-            if not in_position:
-                # Simple entry condition: price above its 20-day moving average
-                ma20 = data['Close'].rolling(window=20).mean().iloc[i]
-                if current_price > ma20:
-                    signals.iloc[i] = 1  # Buy signal
-                    in_position = True
-                    entry_price = current_price
-                    peak_price.iloc[i] = current_price
-            else:
-                # Update peak price if current price is higher
-                if current_price > peak_price.iloc[i-1]:
-                    peak_price.iloc[i] = current_price
-                else:
-                    peak_price.iloc[i] = peak_price.iloc[i-1]
-                
-                # Calculate trailing stop
-                stop_distance = self.multiplier * current_atr
-                stop_price = peak_price.iloc[i] - stop_distance
-                
-                # Check if stop is hit
-                if current_price <= stop_price:
-                    signals.iloc[i] = -1  # Sell signal
-                    in_position = False
-        
-        return signals
+        # Walk the bars carrying the peak/stop state in compiled code, or
+        # trade-by-trade with NumPy scans when Numba isn't installed
+        if NUMBA_AVAILABLE:
+            signals = _atr_trail_signals(close, ma20, atr, float(self.multiplier))
+        else:
+            signals = _atr_trail_signals_np(close, ma20, atr, float(self.multiplier))
+        
+        return pd.Series(signals, index=data.index, copy=False)
 
 class DonchianChannel(Strategy):
     """
@@ -450,7 +784,7 @@ class DonchianChannel(Strategy):
         if tolerance < 0:
             raise ValueError("Tolerance must be non-negative")
     
-    def calculate_donchian_channels(self, data: pd.DataFrame, window: int = 20) -> pd.DataFrame:
+    def calculate_donchian_channels(self, data: pd.DataFrame, window: int = 20) -> Bands:
         """
         Calculate Donchian Channels.
         
@@ -459,22 +793,25 @@ class DonchianChannel(Strategy):
             window: Lookback window for channel calculation
             
         Returns:
-            DataFrame with 'upper', 'middle', and 'lower' channels
+            Bands named tuple of 'middle', 'upper', and 'lower' arrays
         """
-        # Calculate upper channel (highest high over window)
-        upper = data['High'].rolling(window=window).max()
+        high = data['High'].to_numpy(dtype=np.float64)
+        low = data['Low'].to_numpy(dtype=np.float64)
         
-        # Calculate lower channel (lowest low over window)
-        lower = data['Low'].rolling(window=window).min()
+        if bn is not None and window <= len(high):
+            # Calculate upper channel (highest high over window)
+            upper = bn.move_max(high, window=window, min_count=window)
+            
+            # Calculate lower channel (lowest low over window)
+            lower = bn.move_min(low, window=window, min_count=window)
+        else:
+            upper = data['High'].rolling(window=window, min_periods=window).max().to_numpy()
+            lower = data['Low'].rolling(window=window, min_periods=window).min().to_numpy()
         
         # Calculate middle channel (average of upper and lower)
         middle = (upper + lower) / 2
         
-        return pd.DataFrame({
-            'upper': upper,
-            'middle': middle,
-            'lower': lower
-        })
+        return Bands(middle, upper, lower)
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -486,28 +823,47 @@ class DonchianChannel(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate Donchian Channels
         channels = self.calculate_donchian_channels(data, self.window)
-        
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
+        close = data['Close'].to_numpy()
         
         # Skip the first window periods where channels are NaN
-        valid_data = channels['upper'].notna() & channels['lower'].notna()
+        valid_data = ~np.isnan(channels.upper) & ~np.isnan(channels.lower)
         
         # Buy signal: price is above upper channel (uptrend breakout)
         # Use tolerance for more realistic breakout detection
-        upper_threshold = channels['upper'] * (1 - self.tolerance)
-        breakout_up = data['Close'] > upper_threshold
-        signals[breakout_up & valid_data] = 1
+        upper_threshold = channels.upper * (1 - self.tolerance)
+        breakout_up = close > upper_threshold
         
         # Sell signal: price is below lower channel (downtrend breakout)
         # Use tolerance for more realistic breakout detection
-        lower_threshold = channels['lower'] * (1 + self.tolerance)
-        breakout_down = data['Close'] < lower_threshold
-        signals[breakout_down & valid_data] = -1
+        lower_threshold = channels.lower * (1 + self.tolerance)
+        breakout_down = close < lower_threshold
+        
+        # Generate signals
+        signals = _to_signals(breakout_up & valid_data, breakout_down & valid_data)
         
-        return signals
+        return pd.Series(signals, index=data.index, copy=False)
+    
+    def generate_signals_pl(self, data: "pl.DataFrame") -> "pl.Series":
+        """
+        Generate the same signals as generate_signals from a Polars DataFrame.
+        
+        Args:
+            data: Polars DataFrame with 'High', 'Low' and 'Close' columns, in date order
+            
+        Returns:
+            int8 Polars Series with signals: 1 (buy), -1 (sell), 0 (hold)
+        """
+        pl = _polars()
+        close = pl.col('Close').cast(pl.Float64)
+        upper = pl.col('High').cast(pl.Float64).rolling_max(self.window)
+        lower = pl.col('Low').cast(pl.Float64).rolling_min(self.window)
+        breakout_up = close > upper * (1 - self.tolerance)
+        breakout_down = close < lower * (1 + self.tolerance)
+        return _pl_signals(data, breakout_up, breakout_down)
 
 class BollingerBands(Strategy):
     """
@@ -537,7 +893,7 @@ class BollingerBands(Strategy):
         if not 0 <= allocate <= 1:
             raise ValueError("Allocate must be between 0 and 1")
     
-    def calculate_bollinger_bands(self, data: pd.Series, window: int = 20, num_std: float = 2.0) -> pd.DataFrame:
+    def calculate_bollinger_bands(self, data: pd.Series, window: int = 20, num_std: float = 2.0) -> Bands:
         """
         Calculate Bollinger Bands.
         
@@ -547,23 +903,11 @@ class BollingerBands(Strategy):
             num_std: Number of standard deviations for bands
             
         Returns:
-            DataFrame with 'middle', 'upper', and 'lower' bands
+            Bands named tuple of 'middle', 'upper', and 'lower' arrays
         """
-        # Calculate middle band (simple moving average)
-        middle = data.rolling(window=window).mean()
-        
-        # Calculate standard deviation
-        std = data.rolling(window=window).std()
-        
-        # Calculate upper and lower bands
-        upper = middle + (num_std * std)
-        lower = middle - (num_std * std)
-        
-        return pd.DataFrame({
-            'middle': middle,
-            'upper': upper,
-            'lower': lower
-        })
+        # Calculate middle, upper and lower bands in a single pass
+        close = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        return Bands(*_bbands(close, window, float(num_std)))
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -575,18 +919,41 @@ class BollingerBands(Strategy):
         Returns:
             Series with signals: 1 (buy), -1 (sell), 0 (hold)
         """
+        data = self._prepare(data)
+        
         # Calculate Bollinger Bands
         bands = self.calculate_bollinger_bands(data['Close'], self.window, self.num_std)
         
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
+        close = data['Close'].to_numpy()
+        lower, upper = bands.lower, bands.upper
         
         # Buy signal: price crosses below lower band (oversold)
-        oversold = (data['Close'] <= bands['lower']) & (data['Close'].shift(1) > bands['lower'].shift(1))
-        signals[oversold] = 1
+        oversold = np.concatenate(([False], (close[1:] <= lower[1:]) & (close[:-1] > lower[:-1])))
         
         # Sell signal: price crosses above upper band (overbought)
-        overbought = (data['Close'] >= bands['upper']) & (data['Close'].shift(1) < bands['upper'].shift(1))
-        signals[overbought] = -1
+        overbought = np.concatenate(([False], (close[1:] >= upper[1:]) & (close[:-1] < upper[:-1])))
+        
+        # Generate signals
+        signals = _to_signals(oversold, overbought)
         
-        return signals
+        return pd.Series(signals, index=data.index, copy=False)
+    
+    def generate_signals_pl(self, data: "pl.DataFrame") -> "pl.Series":
+        """
+        Generate the same signals as generate_signals from a Polars DataFrame.
+        
+        Args:
+            data: Polars DataFrame with a 'Close' column, in date order
+            
+        Returns:
+            int8 Polars Series with signals: 1 (buy), -1 (sell), 0 (hold)
+        """
+        pl = _polars()
+        close = pl.col('Close').cast(pl.Float64)
+        middle = close.rolling_mean(self.window)
+        std = close.rolling_std(self.window, ddof=1)
+        upper = middle + self.num_std * std
+        lower = middle - self.num_std * std
+        oversold = (close <= lower) & (close.shift(1) > lower.shift(1))
+        overbought = (close >= upper) & (close.shift(1) < upper.shift(1))
+        return _pl_signals(data, oversold, overbought)
@@ -1,11 +1,11 @@
 # scripts/fetch_data.py
 # Usage: python scripts/fetch_data.py --tickers GOOGL WMT AMD --start 2015-01-01 --end 2025-01-01
+#        add --format parquet to write data/{ticker}.parquet instead (needs pyarrow)
 import argparse, os
 import yfinance as yf
 import pandas as pd
 
-def save_csv(ticker: str, outdir: str, start: str, end: str, interval: str):
-    df = yf.download(ticker, start=start, end=end, interval=interval, auto_adjust=False)
+def write_data(df: pd.DataFrame, ticker: str, outdir: str, fmt: str = "csv"):
     if df.empty:
         print(f"[WARN] No data for {ticker}")
         return
@@ -14,10 +14,35 @@ def save_csv(ticker: str, outdir: str, start: str, end: str, interval: str):
     keep = ["Date", "Open", "High", "Low", "Close", "Volume"]
     df = df[keep]
     os.makedirs(outdir, exist_ok=True)
-    out = os.path.join(outdir, f"{ticker}.csv")
-    df.to_csv(out, index=False)
+    if fmt == "parquet":
+        # Binary columnar file in the layout qb.data.load_csv produces (Date
+        # index, numeric columns); load_csv("data/T.csv") picks it up directly
+        out = os.path.join(outdir, f"{ticker}.parquet")
+        df = df.set_index("Date").dropna().sort_index()
+        df.to_parquet(out, compression="zstd")
+    else:
+        out = os.path.join(outdir, f"{ticker}.csv")
+        df.to_csv(out, index=False)
     print(f"[OK] Saved {out}  ({len(df)} rows)")
 
+def save_csvs(tickers: list, outdir: str, start: str, end: str, interval: str, fmt: str = "csv"):
+    # One batched request: yfinance fetches the tickers on its own threads, so
+    # the network round trips overlap instead of running one after another.
+    # (Separate yf.download calls from our own threads aren't safe: download()
+    # keeps its results in module-level state shared between calls.)
+    # actions=False skips the dividend/split columns we'd only drop again,
+    # progress=False skips the progress bar's stdout writes
+    raw = yf.download(tickers, start=start, end=end, interval=interval,
+                      group_by="ticker", threads=True, auto_adjust=False,
+                      actions=False, progress=False)
+    for t in tickers:
+        if isinstance(raw.columns, pd.MultiIndex):
+            df = raw[t] if t in raw.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            df = raw  # older yfinance returns flat columns for a single ticker
+        # Tickers share one date index, so drop dates this one didn't trade
+        write_data(df.dropna(how="all"), t, outdir, fmt)
+
 if __name__ == "__main__":
     p = argparse.ArgumentParser()
     p.add_argument("--tickers", nargs="+", default=["GOOGL", "WMT", "AMD"])
@@ -25,6 +50,6 @@ if __name__ == "__main__":
     p.add_argument("--end",   default="2025-01-01")
     p.add_argument("--interval", default="1d")  # try "1h" later
     p.add_argument("--outdir", default="data")
+    p.add_argument("--format", choices=["csv", "parquet"], default="csv")
     args = p.parse_args()
-    for t in args.tickers:
-        save_csv(t, args.outdir, args.start, args.end, args.interval)
+    save_csvs(args.tickers, args.outdir, args.start, args.end, args.interval, args.format)
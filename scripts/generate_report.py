@@ -11,18 +11,23 @@ This script automatically:
 
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import seaborn as sns
-import glob
+import base64
+import hashlib
+import html
+import io
 import os
+import re
+import sys
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import numpy as np
 
-# Set style for better-looking plots
-try:
-    plt.style.use('seaborn-v0_8')
-except:
-    plt.style.use('default')
-
 # Define a distinct color palette for strategies
 STRATEGY_COLORS = {
     'buy_and_hold': '#1f77b4',      # Blue
@@ -35,8 +40,63 @@ STRATEGY_COLORS = {
     'donchian': '#7f7f7f'           # Gray
 }
 
-# Set a custom color palette
-sns.set_palette(list(STRATEGY_COLORS.values()))
+@contextmanager
+def chart_style():
+    """
+    Style for better-looking plots: seaborn's look with the strategy colors.
+    
+    Only applied while the report charts are drawn, so importing this module
+    (e.g. from main.py) doesn't restyle anyone else's plots.
+    """
+    style = 'seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default'
+    with plt.style.context(style):
+        # Set a custom color palette (undone with the rest of the style on exit)
+        sns.set_palette(list(STRATEGY_COLORS.values()))
+        yield
+
+def _polars():
+    """
+    Import polars, which parses the CSVs in parallel, or return None.
+    
+    It's optional and slow to import, so it's only loaded when the report
+    data is read, not whenever this module is imported (e.g. by main.py).
+    """
+    try:
+        import polars
+    except ImportError:
+        return None
+    return polars
+
+def _pyarrow():
+    """Import pyarrow and its multithreaded CSV reader, or return (None, None)."""
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        return None, None
+    return pyarrow, pyarrow.csv
+
+def _pool_context():
+    """
+    Start method for the chart rendering processes.
+    
+    By the time the charts are drawn, Polars or pyarrow have started their
+    thread pools in this process, and forking a process with running threads
+    can deadlock the child. So on Linux the workers are forked from a clean
+    forkserver process instead, which imports pandas, matplotlib and seaborn
+    once for all of them. Elsewhere we keep the platform default (spawn).
+    """
+    if sys.platform.startswith("linux"):
+        ctx = mp.get_context("forkserver")
+        ctx.set_forkserver_preload(["pandas", "matplotlib.figure", "seaborn"])
+        return ctx
+    return mp.get_context()
+
+# batch_stats_<strategy>.csv -> <strategy>
+_STRATEGY_NAME_RE = re.compile(r"batch_stats_(.+)\.csv$")
+
+# Columns of the batch_stats files the report uses; anything else is skipped when loading
+REPORT_COLUMNS = ['ticker', 'total_return', 'volatility', 'sharpe', 'max_drawdown']
 
 class ReportGenerator:
     def __init__(self):
@@ -44,171 +104,302 @@ class ReportGenerator:
         self.output_dir = "reports"
         self.csv_files = []
         self.all_data = pd.DataFrame()
+        self._fig = None
         
     def find_csv_files(self):
         """Find all batch_stats CSV files"""
-        pattern = os.path.join(self.results_dir, "batch_stats_*.csv")
-        self.csv_files = glob.glob(pattern)
+        # os.scandir lists names and file types in one pass, without a stat per match
+        with os.scandir(self.results_dir) as entries:
+            self.csv_files = sorted(
+                e.path for e in entries
+                if e.name.startswith("batch_stats_") and e.name.endswith(".csv") and e.is_file()
+            )
         print(f"Found {len(self.csv_files)} CSV files:")
         for file in self.csv_files:
             print(f"  - {os.path.basename(file)}")
     
+    @staticmethod
+    def strategy_name(file):
+        """Extract strategy name from a batch_stats_<strategy>.csv filename"""
+        return _STRATEGY_NAME_RE.search(os.path.basename(file)).group(1)
+    
     def load_all_data(self):
         """Load and combine all CSV files"""
-        dataframes = []
+        if not self.csv_files:
+            print("No CSV files found!")
+            return
         
-        for file in self.csv_files:
-            # Extract strategy name from filename
-            strategy_name = os.path.basename(file).replace("batch_stats_", "").replace(".csv", "")
-            
-            # Load CSV
-            df = pd.read_csv(file)
-            df['strategy'] = strategy_name
-            dataframes.append(df)
-        
-        if dataframes:
-            self.all_data = pd.concat(dataframes, ignore_index=True)
-            print(f"Loaded data for {len(self.all_data)} strategy-stock combinations")
+        pl = _polars()
+        pa, pacsv = (None, None) if pl is not None else _pyarrow()
+        if pl is not None:
+            # Scan every file lazily and parse them in one parallel Polars query,
+            # reading only the report columns; the charts and tables use pandas,
+            # so convert once at the end
+            frames = [
+                pl.scan_csv(file)
+                .select(REPORT_COLUMNS)
+                .with_columns(pl.lit(self.strategy_name(file)).alias('strategy'))
+                for file in self.csv_files
+            ]
+            self.all_data = pl.concat(frames, how='vertical_relaxed').collect().to_pandas()
+        elif pa is not None:
+            # Parse just the report columns with pyarrow (in C++, on its own
+            # threads) and concatenate the tables before a single conversion.
+            # Fixed column types keep the per-file schemas identical even when
+            # a column happens to hold only whole numbers
+            convert = pacsv.ConvertOptions(
+                include_columns=REPORT_COLUMNS,
+                column_types={'ticker': pa.string(), **{col: pa.float64() for col in REPORT_COLUMNS[1:]}},
+            )
+            tables = [pacsv.read_csv(file, convert_options=convert) for file in self.csv_files]
+            names = [self.strategy_name(file) for file in self.csv_files]
+            # Tag every row with its strategy in one column for the whole table
+            strategy = np.repeat(names, [len(table) for table in tables])
+            table = pa.concat_tables(tables).append_column('strategy', pa.array(strategy, pa.string()))
+            self.all_data = table.to_pandas()
         else:
-            print("No CSV files found!")
+            dataframes = []
+            for file in self.csv_files:
+                # Load CSV
+                df = pd.read_csv(file, usecols=REPORT_COLUMNS)
+                df['strategy'] = self.strategy_name(file)
+                dataframes.append(df)
+            self.all_data = pd.concat(dataframes, ignore_index=True)
+        
+        # Strategy and ticker names repeat on every row: as categoricals they're
+        # stored once, and the pivots and groupbys work on integer codes
+        self.all_data['strategy'] = self.all_data['strategy'].astype('category')
+        self.all_data['ticker'] = self.all_data['ticker'].astype('category')
+        
+        print(f"Loaded data for {len(self.all_data)} strategy-stock combinations")
     
     def create_summary_table(self):
         """Create a comprehensive summary table"""
         if self.all_data.empty:
             return pd.DataFrame()
         
-        # Convert returns to percentages for better readability
-        summary = self.all_data.copy()
-        summary['total_return_pct'] = summary['total_return'] * 100
-        summary['max_drawdown_pct'] = summary['max_drawdown'] * 100
-        summary['volatility_pct'] = summary['volatility'] * 100
-        
-        # Round for display
-        summary['total_return_pct'] = summary['total_return_pct'].round(1)
-        summary['volatility_pct'] = summary['volatility_pct'].round(1)
-        summary['sharpe'] = summary['sharpe'].round(3)
-        summary['max_drawdown_pct'] = summary['max_drawdown_pct'].round(1)
+        # Build the display columns straight from all_data (percentages, rounded
+        # for display) rather than copying the whole frame and adding to it
+        data = self.all_data
+        return pd.DataFrame({
+            'strategy': data['strategy'],
+            'ticker': data['ticker'],
+            'total_return_pct': (data['total_return'] * 100).round(1),
+            'volatility_pct': (data['volatility'] * 100).round(1),
+            'sharpe': data['sharpe'].round(3),
+            'max_drawdown_pct': (data['max_drawdown'] * 100).round(1),
+        })
+    
+    def _figure(self, figsize):
+        """
+        Return the report's figure, cleared and resized for the next chart.
         
-        return summary[['strategy', 'ticker', 'total_return_pct', 'volatility_pct', 'sharpe', 'max_drawdown_pct']]
+        All charts are drawn on one Figure in turn (each is saved before the
+        next is drawn), so we don't allocate a new figure and canvas per chart.
+        """
+        if self._fig is None:
+            # Draw straight onto an Agg canvas: the report only writes PNGs, so
+            # pyplot never has to pick (and start up) an interactive backend
+            self._fig = Figure(figsize=figsize)
+            FigureCanvasAgg(self._fig)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        return self._fig
     
-    def create_performance_chart(self):
-        """Create a bar chart comparing total returns by strategy and stock"""
+    def create_performance_chart(self, pivot_data=None):
+        """
+        Create a bar chart comparing total returns by strategy and stock
+        
+        pivot_data is the ticker x strategy table of total returns, if the
+        caller already has it (see render_charts)
+        """
         if self.all_data.empty:
             return None
         
-        plt.figure(figsize=(14, 8))
+        fig = self._figure((14, 8))
+        ax = fig.add_subplot()
         
         # Create pivot table for plotting
-        pivot_data = self.all_data.pivot(index='ticker', columns='strategy', values='total_return')
+        if pivot_data is None:
+            pivot_data = self.all_data.pivot(index='ticker', columns='strategy', values='total_return')
         
         # Create bar chart with custom colors
         colors = [STRATEGY_COLORS.get(strategy, '#000000') for strategy in pivot_data.columns]
-        ax = pivot_data.plot(kind='bar', figsize=(14, 8), color=colors)
-        plt.title('Total Returns by Strategy and Stock', fontsize=16, fontweight='bold')
-        plt.xlabel('Stock Ticker', fontsize=12)
-        plt.ylabel('Total Return (Decimal)', fontsize=12)
-        plt.xticks(rotation=45)
-        plt.legend(title='Strategy', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        
-        return plt.gcf()
+        pivot_data.plot(kind='bar', ax=ax, color=colors)
+        ax.set_title('Total Returns by Strategy and Stock', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Stock Ticker', fontsize=12)
+        ax.set_ylabel('Total Return (Decimal)', fontsize=12)
+        ax.tick_params(axis='x', rotation=45)
+        ax.legend(title='Strategy', bbox_to_anchor=(1.05, 1), loc='upper left')
+        fig.tight_layout()
+        
+        return fig
     
-    def create_sharpe_heatmap(self):
-        """Create a heatmap of Sharpe ratios"""
+    def create_sharpe_heatmap(self, pivot_data=None):
+        """
+        Create a heatmap of Sharpe ratios
+        
+        pivot_data is the ticker x strategy table of Sharpe ratios, if the
+        caller already has it (see render_charts)
+        """
         if self.all_data.empty:
             return None
         
-        plt.figure(figsize=(10, 6))
+        fig = self._figure((10, 6))
+        ax = fig.add_subplot()
         
         # Create pivot table for heatmap
-        pivot_data = self.all_data.pivot(index='ticker', columns='strategy', values='sharpe')
+        if pivot_data is None:
+            pivot_data = self.all_data.pivot(index='ticker', columns='strategy', values='sharpe')
         
         # Create heatmap
         sns.heatmap(pivot_data, annot=True, cmap='RdYlGn', center=0, 
-                   fmt='.3f', cbar_kws={'label': 'Sharpe Ratio'})
-        plt.title('Sharpe Ratio Heatmap by Strategy and Stock', fontsize=16, fontweight='bold')
-        plt.tight_layout()
+                   fmt='.3f', cbar_kws={'label': 'Sharpe Ratio'}, ax=ax)
+        ax.set_title('Sharpe Ratio Heatmap by Strategy and Stock', fontsize=16, fontweight='bold')
+        fig.tight_layout()
         
-        return plt.gcf()
+        return fig
     
     def create_risk_return_scatter(self):
         """Create a scatter plot of risk vs return"""
         if self.all_data.empty:
             return None
         
-        plt.figure(figsize=(12, 8))
-        
-        # Create scatter plot with custom colors
-        for strategy in self.all_data['strategy'].unique():
-            strategy_data = self.all_data[self.all_data['strategy'] == strategy]
-            color = STRATEGY_COLORS.get(strategy, '#000000')
-            plt.scatter(strategy_data['volatility'], strategy_data['total_return'], 
-                       label=strategy, s=100, alpha=0.7, color=color)
-            
-            # Add ticker labels
-            for _, row in strategy_data.iterrows():
-                plt.annotate(row['ticker'], (row['volatility'], row['total_return']), 
-                           xytext=(5, 5), textcoords='offset points', fontsize=8)
-        
-        plt.xlabel('Volatility (Risk)', fontsize=12)
-        plt.ylabel('Total Return', fontsize=12)
-        plt.title('Risk vs Return by Strategy and Stock', fontsize=16, fontweight='bold')
-        plt.legend(title='Strategy')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        return plt.gcf()
+        fig = self._figure((12, 8))
+        ax = fig.add_subplot()
+        
+        # Create scatter plot with custom colors: one call for all the points,
+        # colored per strategy, and the ticker labels from plain arrays
+        strategies = self.all_data['strategy']
+        volatility = self.all_data['volatility'].to_numpy()
+        total_return = self.all_data['total_return'].to_numpy()
+        colors = strategies.map(lambda s: STRATEGY_COLORS.get(s, '#000000')).to_numpy()
+        ax.scatter(volatility, total_return, s=100, alpha=0.7, color=colors)
+        
+        # Add ticker labels
+        for ticker, x, y in zip(self.all_data['ticker'].to_numpy(), volatility, total_return):
+            ax.annotate(ticker, (x, y), xytext=(5, 5), textcoords='offset points', fontsize=8)
+        
+        # One legend entry per strategy, drawn like its points
+        handles = [
+            Line2D([], [], linestyle='', marker='o', markersize=10, alpha=0.7,
+                   color=STRATEGY_COLORS.get(strategy, '#000000'), label=strategy)
+            for strategy in strategies.unique()
+        ]
+        
+        ax.set_xlabel('Volatility (Risk)', fontsize=12)
+        ax.set_ylabel('Total Return', fontsize=12)
+        ax.set_title('Risk vs Return by Strategy and Stock', fontsize=16, fontweight='bold')
+        ax.legend(handles=handles, title='Strategy')
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        
+        return fig
     
     def create_strategy_comparison_chart(self):
         """Create a comparison chart showing average performance by strategy"""
         if self.all_data.empty:
             return None
         
-        # Calculate average metrics by strategy
-        strategy_avg = self.all_data.groupby('strategy').agg({
-            'total_return': 'mean',
-            'volatility': 'mean',
-            'sharpe': 'mean',
-            'max_drawdown': 'mean'
-        }).round(4)
+        # Calculate average metrics by strategy. all_data is loaded from the
+        # files in sorted order, so the groups already come out sorted
+        strategy_avg = self.all_data.groupby('strategy', sort=False, observed=True).agg(
+            total_return=('total_return', 'mean'),
+            volatility=('volatility', 'mean'),
+            sharpe=('sharpe', 'mean'),
+            max_drawdown=('max_drawdown', 'mean'),
+        ).round(4)
         
         # Create subplots
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig = self._figure((15, 10))
+        axes = fig.subplots(2, 2)
         fig.suptitle('Strategy Performance Comparison (Averages)', fontsize=16, fontweight='bold')
         
         # Get colors for each strategy
         colors = [STRATEGY_COLORS.get(strategy, '#000000') for strategy in strategy_avg.index]
         
-        # Total Return
-        strategy_avg['total_return'].plot(kind='bar', ax=axes[0,0], color=colors, alpha=0.7)
-        axes[0,0].set_title('Average Total Return')
-        axes[0,0].set_ylabel('Total Return')
-        axes[0,0].tick_params(axis='x', rotation=45)
-        
-        # Volatility
-        strategy_avg['volatility'].plot(kind='bar', ax=axes[0,1], color=colors, alpha=0.7)
-        axes[0,1].set_title('Average Volatility')
-        axes[0,1].set_ylabel('Volatility')
-        axes[0,1].tick_params(axis='x', rotation=45)
-        
-        # Sharpe Ratio
-        strategy_avg['sharpe'].plot(kind='bar', ax=axes[1,0], color=colors, alpha=0.7)
-        axes[1,0].set_title('Average Sharpe Ratio')
-        axes[1,0].set_ylabel('Sharpe Ratio')
-        axes[1,0].tick_params(axis='x', rotation=45)
-        
-        # Max Drawdown
-        strategy_avg['max_drawdown'].plot(kind='bar', ax=axes[1,1], color=colors, alpha=0.7)
-        axes[1,1].set_title('Average Max Drawdown')
-        axes[1,1].set_ylabel('Max Drawdown')
-        axes[1,1].tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        
-        return plt.gcf()
+        # One bar chart per metric, drawn in a single plot call onto the 2x2 grid
+        panels = {
+            'total_return': ('Average Total Return', 'Total Return'),
+            'volatility': ('Average Volatility', 'Volatility'),
+            'sharpe': ('Average Sharpe Ratio', 'Sharpe Ratio'),
+            'max_drawdown': ('Average Max Drawdown', 'Max Drawdown'),
+        }
+        strategy_avg[list(panels)].plot(kind='bar', subplots=True, ax=axes.flat[:len(panels)],
+                                        sharex=False, legend=False, alpha=0.7)
+        
+        for ax, (title, ylabel) in zip(axes.flat, panels.values()):
+            # subplots=True colors by column; color the bars by strategy instead
+            for bar, color in zip(ax.patches, colors):
+                bar.set_facecolor(color)
+            ax.set_title(title)
+            ax.set_ylabel(ylabel)
+            ax.tick_params(axis='x', rotation=45)
+        
+        fig.tight_layout()
+        
+        return fig
+    
+    def render_charts(self):
+        """
+        Draw every chart in the report style; returns {name: base64-encoded PNG}
+        
+        The charts are independent and rasterizing them takes most of the
+        report's time, so each one is rendered in its own process.
+        """
+        if self.all_data.empty:
+            return {}
+        
+        # Reshape to ticker x strategy once for both the bar chart and the heatmap
+        pivots = self.all_data.pivot(index='ticker', columns='strategy',
+                                     values=['total_return', 'sharpe'])
+        
+        # name -> render_chart arguments: data, chart method, method arguments
+        data = self.all_data
+        jobs = {
+            'performance': (data, 'create_performance_chart', pivots['total_return']),
+            'sharpe': (data, 'create_sharpe_heatmap', pivots['sharpe']),
+            'scatter': (data, 'create_risk_return_scatter'),
+            'comparison': (data, 'create_strategy_comparison_chart'),
+        }
+        
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as ex:
+                futs = {name: ex.submit(render_chart, *job) for name, job in jobs.items()}
+                images = {name: fut.result() for name, fut in futs.items()}
+        else:
+            # A single core gains nothing from extra processes
+            images = {name: render_chart(*job) for name, job in jobs.items()}
+        
+        return {name: image for name, image in images.items() if image}
+    
+    def content_hash(self):
+        """
+        Short hash of everything the report is built from.
+        
+        Covers the batch_stats file names (they carry the strategy names) and
+        contents, plus this script's source, so a change to the results or to
+        the report code gives a different hash.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        with open(__file__, 'rb') as f:
+            h.update(f.read())
+        for file in sorted(self.csv_files):
+            h.update(os.path.basename(file).encode())
+            with open(file, 'rb') as f:
+                h.update(f.read())
+        return h.hexdigest()
     
-    def generate_html_report(self):
-        """Generate an HTML report with all tables and charts"""
+    def generate_html_report(self, force=False):
+        """
+        Generate an HTML report with all tables and charts
+        
+        Report file names end in content_hash(), so if a report was already
+        generated from exactly these results it is reused instead of
+        re-rendering every chart (pass force=True to regenerate anyway).
+        """
         if self.all_data.empty:
             print("No data to generate report!")
             return
@@ -216,43 +407,24 @@ class ReportGenerator:
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
         
+        content_hash = self.content_hash()
+        if not force:
+            with os.scandir(self.output_dir) as entries:
+                existing = [e.path for e in entries
+                            if e.name.startswith("backtesting_report_")
+                            and e.name.endswith(f"_{content_hash}.html")]
+            if existing:
+                html_path = max(existing)
+                # Mark it as the latest report (run_all_strategies opens the newest one)
+                os.utime(html_path)
+                print(f"\nResults unchanged, reusing report: {html_path}")
+                return html_path
+        
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Save charts
-        charts = {}
-        
-        # Performance chart
-        perf_chart = self.create_performance_chart()
-        if perf_chart:
-            perf_path = os.path.join(self.output_dir, f"performance_chart_{timestamp}.png")
-            perf_chart.savefig(perf_path, dpi=300, bbox_inches='tight')
-            charts['performance'] = perf_path
-            plt.close(perf_chart)
-        
-        # Sharpe heatmap
-        sharpe_chart = self.create_sharpe_heatmap()
-        if sharpe_chart:
-            sharpe_path = os.path.join(self.output_dir, f"sharpe_heatmap_{timestamp}.png")
-            sharpe_chart.savefig(sharpe_path, dpi=300, bbox_inches='tight')
-            charts['sharpe'] = sharpe_path
-            plt.close(sharpe_chart)
-        
-        # Risk-return scatter
-        scatter_chart = self.create_risk_return_scatter()
-        if scatter_chart:
-            scatter_path = os.path.join(self.output_dir, f"risk_return_scatter_{timestamp}.png")
-            scatter_chart.savefig(scatter_path, dpi=300, bbox_inches='tight')
-            charts['scatter'] = scatter_path
-            plt.close(scatter_chart)
-        
-        # Strategy comparison
-        comp_chart = self.create_strategy_comparison_chart()
-        if comp_chart:
-            comp_path = os.path.join(self.output_dir, f"strategy_comparison_{timestamp}.png")
-            comp_chart.savefig(comp_path, dpi=300, bbox_inches='tight')
-            charts['comparison'] = comp_path
-            plt.close(comp_chart)
+        # Render charts (embedded in the HTML, so the report is a single file)
+        charts = self.render_charts()
         
         # Create summary table
         summary_table = self.create_summary_table()
@@ -261,16 +433,55 @@ class ReportGenerator:
         html_content = self.create_html_report(summary_table, charts, timestamp)
         
         # Save HTML report
-        html_path = os.path.join(self.output_dir, f"backtesting_report_{timestamp}.html")
+        html_path = os.path.join(self.output_dir, f"backtesting_report_{timestamp}_{content_hash}.html")
         with open(html_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         print(f"\nReport generated successfully!")
         print(f"HTML Report: {html_path}")
-        print(f"Charts saved in: {self.output_dir}")
         
         return html_path
     
+    @staticmethod
+    def summary_table_html(summary_table):
+        """
+        HTML for the summary table, formatted in one pass over its rows.
+        
+        Produces the same markup as summary_table.to_html(index=False,
+        classes='data-table') without going through pandas' per-cell
+        formatting machinery; numbers are shown to the precision
+        create_summary_table rounds them to.
+        """
+        def num(value, fmt):
+            return 'NaN' if value != value else format(value, fmt)
+        
+        def text(value):
+            return html.escape(str(value), quote=False)
+        
+        header = ''.join(f'\n      <th>{text(col)}</th>' for col in summary_table.columns)
+        rows = ''.join(
+            '\n    <tr>'
+            f'\n      <td>{text(strategy)}</td>'
+            f'\n      <td>{text(ticker)}</td>'
+            f'\n      <td>{num(total_return, ".1f")}</td>'
+            f'\n      <td>{num(volatility, ".1f")}</td>'
+            f'\n      <td>{num(sharpe, ".3f")}</td>'
+            f'\n      <td>{num(max_drawdown, ".1f")}</td>'
+            '\n    </tr>'
+            for strategy, ticker, total_return, volatility, sharpe, max_drawdown
+            in summary_table.itertuples(index=False, name=None)
+        )
+        return (
+            '<table border="1" class="dataframe data-table">\n'
+            '  <thead>\n'
+            f'    <tr style="text-align: right;">{header}\n'
+            '    </tr>\n'
+            '  </thead>\n'
+            f'  <tbody>{rows}\n'
+            '  </tbody>\n'
+            '</table>'
+        )
+    
     def create_html_report(self, summary_table, charts, timestamp):
         """Create HTML content for the report"""
         html = f"""
@@ -386,26 +597,26 @@ class ReportGenerator:
         </div>
         
         <h2>📋 Detailed Results Table</h2>
-        {summary_table.to_html(index=False, classes='data-table')}
+        {self.summary_table_html(summary_table)}
         
         <h2>📈 Performance Comparison</h2>
         <div class="chart-container">
-            <img src="{os.path.basename(charts.get('performance', ''))}" alt="Performance Chart">
+            <img src="data:image/png;base64,{charts.get('performance', '')}" alt="Performance Chart">
         </div>
         
         <h2>🔥 Sharpe Ratio Heatmap</h2>
         <div class="chart-container">
-            <img src="{os.path.basename(charts.get('sharpe', ''))}" alt="Sharpe Ratio Heatmap">
+            <img src="data:image/png;base64,{charts.get('sharpe', '')}" alt="Sharpe Ratio Heatmap">
         </div>
         
         <h2>⚖️ Risk vs Return Analysis</h2>
         <div class="chart-container">
-            <img src="{os.path.basename(charts.get('scatter', ''))}" alt="Risk Return Scatter">
+            <img src="data:image/png;base64,{charts.get('scatter', '')}" alt="Risk Return Scatter">
         </div>
         
         <h2>📊 Strategy Comparison</h2>
         <div class="chart-container">
-            <img src="{os.path.basename(charts.get('comparison', ''))}" alt="Strategy Comparison">
+            <img src="data:image/png;base64,{charts.get('comparison', '')}" alt="Strategy Comparison">
         </div>
         
         <div class="timestamp">
@@ -435,6 +646,27 @@ class ReportGenerator:
         else:
             print("No data found to generate report")
 
+def render_chart(all_data, method, *args):
+    """
+    Draw one report chart (a ReportGenerator create_* method) as a PNG.
+    
+    Runs in a worker process, with a generator of its own holding all_data.
+    Returns the PNG base64-encoded for a data: URI, or None if the method
+    had nothing to draw.
+    """
+    generator = ReportGenerator()
+    generator.all_data = all_data
+    with chart_style():
+        fig = getattr(generator, method)(*args)
+        if fig is None:
+            return None
+        buf = io.BytesIO()
+        # Screen resolution: the charts are 10-15 inches wide, i.e. 1000-1500px.
+        # Each chart already calls tight_layout (which keeps outside legends in
+        # frame), so skip bbox_inches='tight' and its extra draw pass
+        fig.savefig(buf, format='png', dpi=100)
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
 if __name__ == "__main__":
     generator = ReportGenerator()
     generator.run()
@@ -13,7 +13,33 @@ import os
 import subprocess
 import sys
 import glob
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli.run_batch import run, process_pool
+
+def _list_files(directory, prefix="", suffix=""):
+    """
+    Sorted paths of the regular files in directory named prefix*suffix.
+
+    suffix can also be a tuple of suffixes, as with str.endswith.
+
+    One os.scandir pass reads the names and file types together, instead of
+    glob's pattern matching plus a stat per match; a missing directory
+    gives an empty list, like glob.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                e.path for e in entries
+                if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
 
 class StrategyRunner:
     def __init__(self):
@@ -24,8 +50,7 @@ class StrategyRunner:
         
     def find_strategies(self):
         """Find all available strategy YAML files"""
-        pattern = os.path.join(self.strategies_dir, "*.yaml")
-        strategy_files = glob.glob(pattern)
+        strategy_files = _list_files(self.strategies_dir, suffix=".yaml")
         
         self.available_strategies = [os.path.basename(f) for f in strategy_files]
         print(f"Found {len(self.available_strategies)} strategies:")
@@ -33,36 +58,28 @@ class StrategyRunner:
             print(f"  - {strategy}")
     
     def find_assets(self):
-        """Find all available asset CSV files"""
-        pattern = os.path.join(self.data_dir, "*.csv")
-        asset_files = glob.glob(pattern)
+        """Find all available asset data files (CSV, or Parquet from fetch_data.py --format parquet)"""
+        asset_files = _list_files(self.data_dir, suffix=(".csv", ".parquet"))
         
-        # Extract ticker symbols from filenames
-        self.available_assets = [os.path.basename(f).replace('.csv', '') for f in asset_files]
+        # Extract ticker symbols from filenames; a CSV and its Parquet cache
+        # are the same ticker, and load_csv reads whichever one is there
+        self.available_assets = sorted({os.path.splitext(os.path.basename(f))[0] for f in asset_files})
         print(f"Found {len(self.available_assets)} assets:")
         for asset in self.available_assets:
             print(f"  - {asset}")
     
-    def run_strategy(self, strategy_file, assets):
+    def run_strategy(self, strategy_file, assets, executor=None):
         """Run a single strategy on all assets"""
         print(f"\nRunning {strategy_file}...")
         
-        # Build the command
-        cmd = [
-            sys.executable, "-m", "cli.run_batch",
-            "--tickers"
-        ] + assets + [
-            "--config", os.path.join(self.strategies_dir, strategy_file)
-        ]
-        
         try:
-            # Run the command
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Call cli.run_batch in this process, so its imports and the loaded
+            # price data are shared by every strategy
+            run(assets, os.path.join(self.strategies_dir, strategy_file), executor=executor)
             print(f"{strategy_file} completed successfully")
             return True
-        except subprocess.CalledProcessError as e:
+        except Exception as e:
             print(f"Error running {strategy_file}: {e}")
-            print(f"Error output: {e.stderr}")
             return False
     
     def run_all_strategies(self):
@@ -84,13 +101,22 @@ class StrategyRunner:
             print("❌ No asset files found in data/ directory")
             return False
         
-        # Run each strategy
-        successful_runs = 0
+        # Run the strategies in parallel: each one writes its own
+        # batch_stats_<strategy>.csv, and the backtests themselves run on one
+        # shared process pool, so the threads only load data and collect results
         total_runs = len(self.available_strategies)
-        
-        for strategy in self.available_strategies:
-            if self.run_strategy(strategy, self.available_assets):
-                successful_runs += 1
+        cpus = os.cpu_count() or 1
+        
+        with process_pool(cpus) as pool:
+            # Start the workers now, while this is the only thread: forking
+            # from a process with other threads running can deadlock the child
+            pool.submit(int).result()
+            with ThreadPoolExecutor(max_workers=min(total_runs, cpus)) as executor:
+                results = list(executor.map(
+                    lambda strategy: self.run_strategy(strategy, self.available_assets, pool),
+                    self.available_strategies
+                ))
+        successful_runs = sum(results)
         
         print("\n" + "=" * 60)
         print(f"Strategy Testing Complete!")
@@ -105,7 +131,10 @@ class StrategyRunner:
         try:
             # Run the report generator
             cmd = [sys.executable, "scripts/generate_report.py"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Only stderr is needed (to show on failure), so discard stdout
+            # rather than buffering it
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                           text=True, check=True)
             print("Report generated successfully!")
             return True
         except subprocess.CalledProcessError as e:
@@ -128,17 +157,17 @@ class StrategyRunner:
             print("No report files found")
             return False
         
-        # Get the most recent report
-        latest_report = max(report_files, key=os.path.getctime)
+        # Get the most recent report (an unchanged report that was reused
+        # has its modification time refreshed, so go by that)
+        latest_report = max(report_files, key=os.path.getmtime)
         
-        try:
-            # Open the report
-            subprocess.run(["start", latest_report], shell=True, check=True)
+        # Open the report in the default browser (works on every platform,
+        # without starting a shell)
+        if webbrowser.open(Path(latest_report).resolve().as_uri()):
             print(f"Opened report: {os.path.basename(latest_report)}")
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"Error opening report: {e}")
-            return False
+        print(f"Could not open a browser; the report is at {latest_report}")
+        return False
     
     def run(self):
         """Run the complete process"""
@@ -8,22 +8,24 @@ and generates a comprehensive comparison chart and table.
 
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import yaml
+import argparse
 import os
+import functools
+from contextlib import ExitStack
 from datetime import datetime
 
 # Add parent directory to path
 import sys
-import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import our framework
 from qb.data import load_csv
+from qb.config import load_config
 from qb.strategy import (BuyAndHold, SmaCrossover, RSI, BollingerBands, 
                         MA200, Momentum, ATRTrailingStop, DonchianChannel)
 from qb.backtester import Backtester
 from qb.metrics import equity_stats
+from cli.run_batch import process_pool
 
 # Strategy configurations
 STRATEGIES = [
@@ -77,6 +79,33 @@ STRATEGIES = [
     }
 ]
 
+def _run_one(strategy_config, data, config):
+    """
+    Backtest one strategy on the data with its parsed YAML config.
+    
+    Module-level so it can run in a worker process. Returns the result row
+    for the comparison table and the strategy's equity curve.
+    """
+    # Create strategy instance
+    strategy = strategy_config['class'](**config['params'])
+    
+    # Run backtest
+    backtester = Backtester(data, strategy, initial_cash=config['initial_cash'])
+    backtest_results = backtester.run()
+    
+    # Calculate metrics
+    stats = equity_stats(backtest_results['equity'])
+    
+    result = {
+        'Strategy': strategy_config['name'],
+        'Total Return (%)': stats['total_return'] * 100,
+        'Volatility (%)': stats['volatility'] * 100,
+        'Sharpe Ratio': stats['sharpe'],
+        'Max Drawdown (%)': stats['max_drawdown'] * 100,
+        'Color': strategy_config['color']
+    }
+    return result, backtest_results['equity']
+
 def run_strategy_comparison(ticker='GOOGL'):
     """Run comparison of all strategies on a single stock"""
     
@@ -86,46 +115,43 @@ def run_strategy_comparison(ticker='GOOGL'):
     data = load_csv(f'data/{ticker}.csv')
     print(f"Loaded {len(data)} days of {ticker} data")
     
+    # Load every strategy configuration up front
+    configs = []
+    for strategy_config in STRATEGIES:
+        try:
+            configs.append((strategy_config, load_config(f'strategies/{strategy_config["yaml_file"]}')))
+        except Exception as e:
+            print(f"Error testing {strategy_config['name']}: {e}")
+    
     # Results storage
     results = []
     equity_curves = {}
     
-    # Test each strategy
-    for strategy_config in STRATEGIES:
-        print(f"Testing {strategy_config['name']}...")
+    # Test each strategy: the backtests are independent, so they run in
+    # parallel, one process per strategy (in this process on a single core).
+    # Results are collected in STRATEGIES order either way
+    workers = min(len(configs), os.cpu_count() or 1)
+    with ExitStack() as stack:
+        if workers > 1:
+            ex = stack.enter_context(process_pool(workers))
+            jobs = [ex.submit(_run_one, strategy_config, data, config).result
+                    for strategy_config, config in configs]
+        else:
+            jobs = [functools.partial(_run_one, strategy_config, data, config)
+                    for strategy_config, config in configs]
         
-        try:
-            # Load strategy configuration
-            with open(f'strategies/{strategy_config["yaml_file"]}', 'r') as f:
-                config = yaml.safe_load(f)
-            
-            # Create strategy instance
-            strategy = strategy_config['class'](**config['params'])
-            
-            # Run backtest
-            backtester = Backtester(data, strategy, initial_cash=config['initial_cash'])
-            backtest_results = backtester.run()
+        for (strategy_config, _), job in zip(configs, jobs):
+            print(f"Testing {strategy_config['name']}...")
             
-            # Calculate metrics
-            stats = equity_stats(backtest_results['equity'])
+            try:
+                result, equity = job()
+            except Exception as e:
+                print(f"Error testing {strategy_config['name']}: {e}")
+                continue
             
-            # Store results
-            result = {
-                'Strategy': strategy_config['name'],
-                'Total Return (%)': stats['total_return'] * 100,
-                'Volatility (%)': stats['volatility'] * 100,
-                'Sharpe Ratio': stats['sharpe'],
-                'Max Drawdown (%)': stats['max_drawdown'] * 100,
-                'Color': strategy_config['color']
-            }
+            # Store results and equity curve
             results.append(result)
-            
-            # Store equity curve
-            equity_curves[strategy_config['name']] = backtest_results['equity']
-            
-        except Exception as e:
-            print(f"Error testing {strategy_config['name']}: {e}")
-            continue
+            equity_curves[strategy_config['name']] = equity
     
     return results, equity_curves, data
 
@@ -141,9 +167,14 @@ def create_comparison_charts(results, equity_curves, data, ticker):
     
     # 1. Equity Curves Comparison
     ax1 = fig.add_subplot(gs[0, :])
-    for strategy_name, equity in equity_curves.items():
-        color = next(r['Color'] for r in results if r['Strategy'] == strategy_name)
-        ax1.plot(equity.index, equity, label=strategy_name, linewidth=2, color=color)
+    color_by_strategy = {r['Strategy']: r['Color'] for r in results}
+    # Every curve is on the data's date index, so they go in as the columns
+    # of one matrix in a single plot call
+    curves = pd.DataFrame(equity_curves)
+    lines = ax1.plot(curves.index, curves.to_numpy(), linewidth=2)
+    for line, strategy_name in zip(lines, curves.columns):
+        line.set_label(strategy_name)
+        line.set_color(color_by_strategy[strategy_name])
     
     ax1.set_title(f'{ticker} - Strategy Equity Curves Comparison', fontsize=16, fontweight='bold')
     ax1.set_ylabel('Portfolio Value ($)')
@@ -160,10 +191,8 @@ def create_comparison_charts(results, equity_curves, data, ticker):
     ax2.tick_params(axis='x', rotation=45)
     
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{height:.1f}%', ha='center', va='bottom', fontsize=9)
+    ax2.bar_label(bars, labels=[f'{h:.1f}%' for h in df_results['Total Return (%)']],
+                  padding=3, fontsize=9)
     
     # 3. Sharpe Ratio Comparison
     ax3 = fig.add_subplot(gs[1, 1])
@@ -174,10 +203,8 @@ def create_comparison_charts(results, equity_curves, data, ticker):
     ax3.axhline(y=0, color='black', linestyle='-', alpha=0.5)
     
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                f'{height:.3f}', ha='center', va='bottom', fontsize=9)
+    ax3.bar_label(bars, labels=[f'{h:.3f}' for h in df_results['Sharpe Ratio']],
+                  padding=3, fontsize=9)
     
     # 4. Risk-Return Scatter
     ax4 = fig.add_subplot(gs[2, 0])
@@ -199,11 +226,9 @@ def create_comparison_charts(results, equity_curves, data, ticker):
     ax5.set_ylabel('Max Drawdown (%)')
     ax5.tick_params(axis='x', rotation=45)
     
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax5.text(bar.get_x() + bar.get_width()/2., height - 1,
-                f'{height:.1f}%', ha='center', va='top', fontsize=9)
+    # Add value labels on bars (the drawdowns are negative, so they go below the bar ends)
+    ax5.bar_label(bars, labels=[f'{h:.1f}%' for h in df_results['Max Drawdown (%)']],
+                  padding=3, label_type='edge', fontsize=9)
     
     plt.suptitle(f'{ticker} - Comprehensive Strategy Comparison', fontsize=18, fontweight='bold')
     plt.tight_layout()
@@ -231,9 +256,16 @@ def create_comparison_table(results):
     
     return display_df
 
-def main():
+def main(argv=None):
     """Main function"""
     
+    p = argparse.ArgumentParser()
+    # Chart resolution: 150 DPI is plenty on screen, --publish saves at 300
+    p.add_argument("--dpi", type=int, default=150)
+    p.add_argument("--publish", action="store_true")
+    args = p.parse_args(argv)
+    dpi = 300 if args.publish else args.dpi
+    
     # Choose ticker (GOOGL or NVDA)
     ticker = 'GOOGL'  # Change to 'NVDA' for different stock
     
@@ -264,9 +296,10 @@ def main():
     # Create and save charts
     fig = create_comparison_charts(results, equity_curves, data, ticker)
     
-    # Save chart
+    # Save chart (PNG encoding dominates here, so use zlib's fast level)
     chart_filename = f"strategy_comparison_{ticker}_{timestamp}.png"
-    fig.savefig(chart_filename, dpi=300, bbox_inches='tight')
+    fig.savefig(chart_filename, dpi=dpi, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
     print(f"Comparison chart saved to: {chart_filename}")
     
     # Show the best performing strategies
@@ -50,6 +50,13 @@ setup(
             "flake8>=4.0",
             "mypy>=0.950",
         ],
+        "fast": [
+            "numba>=0.56",
+            "bottleneck>=1.3",
+        ],
+        "polars": [
+            "polars>=0.20",
+        ],
         "notebooks": [
             "jupyter>=1.0.0",
             "notebook>=6.4.0",
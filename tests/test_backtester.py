@@ -19,25 +19,31 @@ from qb.metrics import equity_stats
 class TestBacktester(unittest.TestCase):
     """Test cases for the Backtester class"""
     
-    def setUp(self):
-        """Set up test data"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data (built once for the class; tests only read it)"""
         # Create simple test data
         dates = pd.date_range('2023-01-01', periods=100, freq='D')
         
         # Create a simple price series with some trends
-        np.random.seed(42)
+        rng = np.random.RandomState(42)
         base_price = 100
         trend = np.linspace(0, 20, 100)
-        noise = np.random.normal(0, 2, 100)
+        noise = rng.normal(0, 2, 100)
         close_prices = base_price + trend + noise
         
-        self.test_data = pd.DataFrame({
-            'Open': close_prices * 0.99,
-            'High': close_prices * 1.02,
-            'Low': close_prices * 0.98,
-            'Close': close_prices,
-            'Volume': np.random.randint(1000000, 5000000, 100)
-        }, index=dates)
+        # Open/High/Low/Close as fixed multiples of the close, in one broadcast
+        ohlc = close_prices[:, None] * np.array([0.99, 1.02, 0.98, 1.0])
+        cls.test_data = pd.DataFrame(ohlc, index=dates, columns=['Open', 'High', 'Low', 'Close'])
+        cls.test_data['Volume'] = rng.randint(1000000, 5000000, 100)
+        
+        # The buy-and-hold and SMA crossover backtests several tests check,
+        # run once here
+        cls._bh_backtester = Backtester(cls.test_data, BuyAndHold(allocate=1.0), initial_cash=100000)
+        cls._bh_results = cls._bh_backtester.run()
+        cls._sma_backtester = Backtester(cls.test_data, SmaCrossover(fast=5, slow=10, allocate=1.0),
+                                         initial_cash=100000)
+        cls._sma_results = cls._sma_backtester.run()
     
     def test_backtester_initialization(self):
         """Test backtester initialization"""
@@ -50,9 +56,7 @@ class TestBacktester(unittest.TestCase):
     
     def test_buy_and_hold_backtest(self):
         """Test buy and hold strategy backtest"""
-        strategy = BuyAndHold(allocate=1.0)
-        backtester = Backtester(self.test_data, strategy, initial_cash=100000)
-        results = backtester.run()
+        results = self._bh_results
         
         # Check that we have equity curve
         self.assertIn('equity', results)
@@ -66,9 +70,7 @@ class TestBacktester(unittest.TestCase):
     
     def test_sma_crossover_backtest(self):
         """Test SMA crossover strategy backtest"""
-        strategy = SmaCrossover(fast=5, slow=10, allocate=1.0)
-        backtester = Backtester(self.test_data, strategy, initial_cash=100000)
-        results = backtester.run()
+        results = self._sma_results
         
         # Check that we have equity curve
         self.assertIn('equity', results)
@@ -77,13 +79,22 @@ class TestBacktester(unittest.TestCase):
         # Check that equity starts at initial cash
         self.assertEqual(results['equity'].iloc[0], 100000)
     
+    def test_positions_hold_between_signals(self):
+        """Test that positions only change on bars with a signal"""
+        strategy = SmaCrossover(fast=5, slow=10, allocate=0.5)
+        backtester = Backtester(self.test_data, strategy, initial_cash=100000)
+        results = backtester.run()
+
+        signals = strategy.generate_signals(self.test_data)
+        changed = results['positions'].diff().fillna(results['positions']) != 0
+
+        # Every position change must line up with a buy or sell signal
+        self.assertTrue((signals[changed] != 0).all())
+        self.assertEqual(len(results['positions']), len(self.test_data))
+
     def test_get_trades(self):
         """Test getting trade information"""
-        strategy = SmaCrossover(fast=5, slow=10, allocate=1.0)
-        backtester = Backtester(self.test_data, strategy, initial_cash=100000)
-        backtester.run()
-        
-        trades = backtester.get_trades()
+        trades = self._sma_backtester.get_trades()
         
         # Should return a list
         self.assertIsInstance(trades, list)
@@ -99,12 +110,8 @@ class TestBacktester(unittest.TestCase):
     
     def test_metrics_calculation(self):
         """Test that metrics can be calculated from backtest results"""
-        strategy = BuyAndHold(allocate=1.0)
-        backtester = Backtester(self.test_data, strategy, initial_cash=100000)
-        results = backtester.run()
-        
         # Calculate metrics
-        stats = equity_stats(results['equity'])
+        stats = equity_stats(self._bh_results['equity'])
         
         # Check that all required metrics are present
         required_metrics = ['total_return', 'volatility', 'sharpe', 'max_drawdown']
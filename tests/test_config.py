@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for strategy configuration loading
+"""
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qb.config import load_config
+
+STRATEGIES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'strategies')
+
+class TestLoadConfig(unittest.TestCase):
+    """Test cases for load_config"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_load_yaml(self):
+        """Test loading one of the bundled YAML strategy configs"""
+        cfg = load_config(os.path.join(STRATEGIES_DIR, 'sma_crossover.yaml'))
+        
+        self.assertEqual(cfg['name'], 'sma_crossover')
+        self.assertIn('params', cfg)
+    
+    def test_json_matches_yaml(self):
+        """Test that a JSON config gives the same dictionary as its YAML twin"""
+        yaml_cfg = load_config(os.path.join(STRATEGIES_DIR, 'rsi.yaml'))
+        json_path = os.path.join(self.tmpdir, 'rsi.json')
+        with open(json_path, 'w') as f:
+            json.dump(yaml_cfg, f)
+        
+        self.assertEqual(load_config(json_path), yaml_cfg)
+    
+    def test_cached_config_is_copied_and_reloaded(self):
+        """Test that cached configs can't be modified by callers and follow file edits"""
+        path = os.path.join(self.tmpdir, 'cfg.json')
+        with open(path, 'w') as f:
+            json.dump({'name': 'rsi', 'params': {'period': 14}}, f)
+        
+        cfg = load_config(path)
+        cfg['params']['period'] = 2
+        self.assertEqual(load_config(path)['params']['period'], 14)
+        
+        with open(path, 'w') as f:
+            json.dump({'name': 'rsi', 'params': {'period': 21, 'oversold': 30}}, f)
+        self.assertEqual(load_config(path)['params'], {'period': 21, 'oversold': 30})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the data loading module
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qb.data import load_csv
+
+CSV_TEXT = """Date,Open,High,Low,Close,Volume
+,TEST,TEST,TEST,TEST,TEST
+2023-01-03,10.0,11.0,9.5,10.5,1000
+2023-01-02,9.0,10.0,8.5,9.5,2000
+2023-01-04,10.5,12.0,10.0,11.5,1500
+"""
+
+class TestLoadCsv(unittest.TestCase):
+    """Test cases for load_csv"""
+    
+    def setUp(self):
+        """Write a small CSV in the same layout as the files in data/"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmpdir, 'TEST.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write(CSV_TEXT)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_load_csv_cleans_data(self):
+        """Test that ticker rows are dropped and dates are sorted"""
+        df = load_csv(self.csv_path)
+        
+        self.assertEqual(len(df), 3)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertEqual(df['Close'].iloc[0], 9.5)
+        self.assertEqual(list(df.columns), ['Open', 'High', 'Low', 'Close', 'Volume'])
+    
+    def test_cached_load_matches_csv(self):
+        """Test that a second load returns the same data as the first"""
+        first = load_csv(self.csv_path)
+        second = load_csv(self.csv_path)
+        pd.testing.assert_frame_equal(first, second)
+        
+        refreshed = load_csv(self.csv_path, refresh_cache=True)
+        pd.testing.assert_frame_equal(first, refreshed)
+
+    def test_in_memory_cache_is_isolated(self):
+        """Test that adding columns to a loaded frame doesn't leak into later loads"""
+        first = load_csv(self.csv_path)
+        first['Signal'] = 1
+        
+        second = load_csv(self.csv_path)
+        self.assertNotIn('Signal', second.columns)
+    
+    def test_in_memory_cache_sees_file_changes(self):
+        """Test that an edited CSV is re-read instead of served from memory"""
+        first = load_csv(self.csv_path)
+        with open(self.csv_path, 'a') as f:
+            f.write("2023-01-05,11.5,12.5,11.0,12.0,1200\n")
+        # Make sure the modification time moves forward even on coarse clocks
+        mtime = os.path.getmtime(self.csv_path) + 10
+        os.utime(self.csv_path, (mtime, mtime))
+        
+        second = load_csv(self.csv_path)
+        self.assertEqual(len(second), len(first) + 1)
+
+    def test_load_parquet_without_csv(self):
+        """Test that a Parquet file written by fetch_data.py loads without a CSV"""
+        expected = load_csv(self.csv_path)
+        parquet_path = os.path.join(self.tmpdir, 'ONLY.parquet')
+        expected.to_parquet(parquet_path, compression='zstd')
+        
+        df = load_csv(os.path.join(self.tmpdir, 'ONLY.csv'))
+        pd.testing.assert_frame_equal(df, expected)
+        
+        refreshed = load_csv(os.path.join(self.tmpdir, 'ONLY.csv'), refresh_cache=True)
+        pd.testing.assert_frame_equal(refreshed, expected)
+
+    def test_concurrent_cache_writes(self):
+        """Test that threads rebuilding the same Parquet cache leave a complete file"""
+        expected = load_csv(self.csv_path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: load_csv(self.csv_path, refresh_cache=True), range(16)))
+        
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ['TEST.csv', 'TEST.parquet'])
+        pd.testing.assert_frame_equal(pd.read_parquet(os.path.join(self.tmpdir, 'TEST.parquet')),
+                                      expected)
+
+if __name__ == "__main__":
+    unittest.main()
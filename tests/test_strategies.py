@@ -11,41 +11,77 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import shutil
+import tempfile
 
 # Add parent directory to path to import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from qb.strategy import (BuyAndHold, SmaCrossover, RSI, BollingerBands, 
                         MA200, Momentum, ATRTrailingStop, DonchianChannel)
+from qb.strategy import _rolling_means, _atr_trail_signals_np, batch_sma_signals
+from qb._indicators_numba import _atr_trail_signals, _sma_cross, _atr
+import qb.cache
+from qb._njit import njit
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+@njit(cache=True)
+def _all_signals_valid(a):
+    """Whether every value in the signal array is -1, 0 or 1"""
+    for i in range(a.shape[0]):
+        v = a[i]
+        if v != -1 and v != 0 and v != 1:
+            return False
+    return True
+
+def _count_signals(signals):
+    """(buy, sell) counts of a signal Series, from one bincount pass"""
+    counts = np.bincount(signals.to_numpy().astype(np.int64) + 1, minlength=3)
+    return int(counts[2]), int(counts[0])
 
 class TestStrategies(unittest.TestCase):
     """Test cases for all trading strategies"""
     
-    def setUp(self):
-        """Set up test data"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data (built once for the class; tests only read it)"""
         # Create simple test data
         dates = pd.date_range('2023-01-01', periods=100, freq='D')
         
         # Create a simple price series with some trends
-        np.random.seed(42)  # For reproducible tests
+        rng = np.random.RandomState(42)  # For reproducible tests
         base_price = 100
         trend = np.linspace(0, 20, 100)  # Upward trend
-        noise = np.random.normal(0, 2, 100)
+        noise = rng.normal(0, 2, 100)
         close_prices = base_price + trend + noise
         
-        # Create OHLCV data
-        self.test_data = pd.DataFrame({
-            'Open': close_prices * 0.99,
-            'High': close_prices * 1.02,
-            'Low': close_prices * 0.98,
-            'Close': close_prices,
-            'Volume': np.random.randint(1000000, 5000000, 100)
-        }, index=dates)
+        # Create OHLCV data: Open/High/Low/Close as fixed multiples of the close, in one broadcast
+        ohlc = close_prices[:, None] * np.array([0.99, 1.02, 0.98, 1.0])
+        cls.test_data = pd.DataFrame(ohlc, index=dates, columns=['Open', 'High', 'Low', 'Close'])
+        cls.test_data['Volume'] = rng.randint(1000000, 5000000, 100)
+        cls._signals_cache = {}
+    
+    @classmethod
+    def _get_signals(cls, strategy):
+        """
+        Signals of strategy on the test data, computed once per set of parameters.
+        
+        The per-strategy tests and test_signal_consistency check the same
+        strategies, so the second one to run reuses the first one's signals.
+        """
+        key = (type(strategy).__name__, tuple(sorted(strategy.__dict__.items())))
+        if key not in cls._signals_cache:
+            cls._signals_cache[key] = strategy.generate_signals(cls.test_data)
+        return cls._signals_cache[key]
     
     def test_buy_and_hold(self):
         """Test Buy & Hold strategy"""
         strategy = BuyAndHold(allocate=1.0)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have exactly one buy signal at the beginning
         self.assertEqual(signals.sum(), 1)
@@ -55,115 +91,237 @@ class TestStrategies(unittest.TestCase):
     def test_sma_crossover(self):
         """Test SMA Crossover strategy"""
         strategy = SmaCrossover(fast=5, slow=10, allocate=1.0)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals (not all zeros)
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
     def test_rsi(self):
         """Test RSI strategy"""
         strategy = RSI(period=14, lower=30, upper=70, allocate=1.0)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
+    def test_rsi_wilder_values(self):
+        """Test RSI range and edge cases of Wilder's smoothing"""
+        strategy = RSI(period=14)
+        rsi = strategy.calculate_rsi(self.test_data['Close'], 14)
+        
+        # Warm-up period is NaN, the rest is bounded
+        self.assertTrue(rsi.iloc[:14].isna().all())
+        valid = rsi.dropna()
+        self.assertTrue(((valid >= 0) & (valid <= 100)).all())
+        
+        # Prices that only go up have no losses, so RSI is pinned at 100
+        rising = pd.Series(np.arange(1.0, 31.0), index=self.test_data.index[:30])
+        self.assertTrue((strategy.calculate_rsi(rising, 14).dropna() == 100).all())
+    
+    def test_rsi_matches_wilder_ewm(self):
+        """Test RSI against Wilder's smoothing expressed as a pandas EWM"""
+        period = 14
+        close = self.test_data['Close']
+        delta = close.diff()
+        
+        def wilder(values):
+            # Seed with the simple mean of the first period, then alpha = 1/period
+            seeded = values.iloc[period:].copy()
+            seeded.iloc[0] = values.iloc[1:period + 1].mean()
+            return seeded.ewm(alpha=1 / period, adjust=False).mean()
+        
+        avg_gain = wilder(delta.clip(lower=0))
+        avg_loss = wilder(-delta.clip(upper=0))
+        expected = 100 - 100 / (1 + avg_gain / avg_loss)
+        
+        rsi = RSI(period=period).calculate_rsi(close, period)
+        np.testing.assert_allclose(rsi.iloc[period:], expected)
+    
     def test_bollinger_bands(self):
         """Test Bollinger Bands strategy"""
         strategy = BollingerBands(window=20, num_std=2.0, allocate=1.0)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
+    def test_bollinger_bands_match_pandas(self):
+        """Test fused band calculation against pandas rolling mean/std"""
+        strategy = BollingerBands(window=20, num_std=2.0)
+        close = self.test_data['Close']
+        bands = strategy.calculate_bollinger_bands(close, 20, 2.0)
+        
+        middle = close.rolling(20).mean()
+        std = close.rolling(20).std()
+        np.testing.assert_allclose(bands.middle, middle, equal_nan=True)
+        np.testing.assert_allclose(bands.upper, middle + 2.0 * std, equal_nan=True)
+        np.testing.assert_allclose(bands.lower, middle - 2.0 * std, equal_nan=True)
+    
+    def test_bollinger_bands_flat_window(self):
+        """Test that a window of one repeated price gives exact zero-width bands"""
+        close = self.test_data['Close'].copy()
+        close.iloc[60:80] = 1.7999999523162842
+        bands = BollingerBands().calculate_bollinger_bands(close, 5, 2.0)
+        
+        flat = slice(64, 80)
+        np.testing.assert_array_equal(bands.middle[flat], close[flat])
+        np.testing.assert_array_equal(bands.upper[flat], close[flat])
+        np.testing.assert_array_equal(bands.lower[flat], close[flat])
+    
     def test_ma200(self):
         """Test MA200 strategy"""
         strategy = MA200(window=50, allocate=1.0, buffer_pct=0.0)  # Using shorter window for test
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
     def test_momentum(self):
         """Test Momentum strategy"""
         strategy = Momentum(lookback=20, allocate=1.0)  # Using shorter lookback for test
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
     def test_atr_trailing_stop(self):
         """Test ATR Trailing Stop strategy"""
         strategy = ATRTrailingStop(window=14, multiplier=3.0, allocate=1.0)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
+    def test_atr_trailing_stop_numpy_path(self):
+        """Test that the NumPy fallback matches the bar-by-bar kernel"""
+        strategy = ATRTrailingStop(window=5, multiplier=1.0)
+        close = self.test_data['Close'].to_numpy()
+        ma20 = self.test_data['Close'].rolling(20).mean().to_numpy()
+        atr = strategy.calculate_atr(self.test_data, 5).to_numpy()
+        
+        expected = _atr_trail_signals(close, ma20, atr, 1.0)
+        actual = _atr_trail_signals_np(close, ma20, atr, 1.0)
+        np.testing.assert_array_equal(actual, expected)
+        self.assertTrue((expected == -1).any())
+    
+    def test_atr_kernel_matches_pandas(self):
+        """Test the fused ATR kernel against the pandas true-range formula"""
+        data = self.test_data
+        high_low = data['High'] - data['Low']
+        high_close = np.abs(data['High'] - data['Close'].shift(1))
+        low_close = np.abs(data['Low'] - data['Close'].shift(1))
+        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
+        
+        atr = _atr(data['High'].to_numpy(), data['Low'].to_numpy(), data['Close'].to_numpy(), 14)
+        np.testing.assert_array_equal(atr, true_range.rolling(14).mean().to_numpy())
+    
+    def test_atr_trailing_stop_matches_bar_loop(self):
+        """Test the ATR trailing stop against a plain bar-by-bar reference loop"""
+        strategy = ATRTrailingStop(window=5, multiplier=1.0)
+        signals = strategy.generate_signals(self.test_data).to_numpy()
+        
+        close = self.test_data['Close']
+        ma20 = close.rolling(window=20).mean()
+        atr = strategy.calculate_atr(self.test_data, 5)
+        
+        expected = np.zeros(len(close), dtype=np.int8)
+        in_position, peak = False, 0.0
+        for i in range(1, len(close)):
+            price = close.iloc[i]
+            if not in_position:
+                if price > ma20.iloc[i]:
+                    expected[i], in_position, peak = 1, True, price
+            else:
+                peak = max(peak, price)
+                if price <= peak - 1.0 * atr.iloc[i]:
+                    expected[i], in_position = -1, False
+        
+        np.testing.assert_array_equal(signals, expected)
+    
     def test_donchian_channel(self):
         """Test Donchian Channel strategy"""
         strategy = DonchianChannel(window=20, allocate=1.0, tolerance=0.01)
-        signals = strategy.generate_signals(self.test_data)
+        signals = self._get_signals(strategy)
         
         # Should have some signals
         self.assertTrue(len(signals[signals != 0]) > 0)
         
         # All signals should be 1, -1, or 0
-        self.assertTrue(all(signals.isin([1, -1, 0])))
+        self.assertTrue(_all_signals_valid(signals.to_numpy()))
         
         # Check that we have both buy and sell signals
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         self.assertTrue(buy_signals > 0 or sell_signals > 0)
     
+    def test_rolling_means_match_pandas(self):
+        """Test cumulative-sum moving averages against pandas rolling means"""
+        close = self.test_data['Close'].copy()
+        close.iloc[30] = np.nan  # NaN should blank out every window containing it
+        
+        fast, slow = _rolling_means(close.to_numpy(), 5, 20)
+        np.testing.assert_allclose(fast, close.rolling(5).mean().to_numpy(), equal_nan=True)
+        np.testing.assert_allclose(slow, close.rolling(20).mean().to_numpy(), equal_nan=True)
+        
+        # A window longer than the data is all NaN
+        (too_long,) = _rolling_means(close.to_numpy(), 500)
+        self.assertTrue(np.isnan(too_long).all())
+    
+    def test_sma_cross_kernel_matches_pandas(self):
+        """Test the fused SMA crossover kernel against pandas rolling means"""
+        close = self.test_data['Close'].copy()
+        close.iloc[40:60] = 100.0  # flat stretch: both averages tie exactly
+        close.iloc[70] = np.nan
+        
+        fast = close.rolling(2).mean()
+        slow = close.rolling(4).mean()
+        expected = np.where((fast > slow) & (fast.shift(1) <= slow.shift(1)), 1,
+                            np.where((fast < slow) & (fast.shift(1) >= slow.shift(1)), -1, 0))
+        
+        signals = _sma_cross(close.to_numpy(), 2, 4)
+        np.testing.assert_array_equal(signals, expected)
+    
     def test_strategy_validation(self):
         """Test strategy parameter validation"""
         
@@ -189,6 +347,78 @@ class TestStrategies(unittest.TestCase):
         with self.assertRaises(ValueError):
             DonchianChannel(tolerance=-0.1)  # Negative tolerance
     
+    def test_cached_signals(self):
+        """Test that signals loaded from the disk cache match a fresh computation"""
+        # No built-in strategy is worth caching, so wrap one the way a slow
+        # custom strategy would be
+        class CachedSma(SmaCrossover):
+            generate_signals = qb.cache.cached_signals()(SmaCrossover.generate_signals)
+        
+        cache_dir = tempfile.mkdtemp()
+        old_dir, old_rows = qb.cache.SIGNAL_CACHE_DIR, qb.cache.MIN_CACHE_ROWS
+        qb.cache.MIN_CACHE_ROWS = 0
+        try:
+            # The cache is opt-in
+            self.assertIsNone(old_dir)
+            
+            qb.cache.SIGNAL_CACHE_DIR = cache_dir
+            strategy = CachedSma(fast=5, slow=10, allocate=1.0)
+            first = strategy.generate_signals(self.test_data)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            
+            second = strategy.generate_signals(self.test_data)
+            pd.testing.assert_series_equal(first, second)
+            pd.testing.assert_series_equal(
+                first, SmaCrossover(fast=5, slow=10).generate_signals(self.test_data))
+            
+            # Different parameters get their own cache entry
+            CachedSma(fast=5, slow=20).generate_signals(self.test_data)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+        finally:
+            qb.cache.SIGNAL_CACHE_DIR, qb.cache.MIN_CACHE_ROWS = old_dir, old_rows
+            shutil.rmtree(cache_dir)
+    
+    def test_object_dtype_prices(self):
+        """Test that object-dtype price columns give the same signals as float64"""
+        as_objects = self.test_data.astype(object)
+        for strategy in [RSI(), BollingerBands(), ATRTrailingStop(window=5), DonchianChannel()]:
+            pd.testing.assert_series_equal(strategy.generate_signals(as_objects),
+                                           strategy.generate_signals(self.test_data))
+    
+    @unittest.skipIf(pl is None, "polars not installed")
+    def test_polars_signals_match_pandas(self):
+        """Test that the Polars signal path matches the pandas one"""
+        frame = pl.from_pandas(self.test_data.reset_index())
+        strategies = [
+            SmaCrossover(fast=5, slow=10),
+            MA200(window=50, buffer_pct=0.01),
+            Momentum(lookback=20),
+            BollingerBands(window=20, num_std=2.0),
+            DonchianChannel(window=20, tolerance=0.01),
+        ]
+        for strategy in strategies:
+            expected = strategy.generate_signals(self.test_data).to_numpy()
+            actual = strategy.generate_signals_pl(frame).to_numpy()
+            np.testing.assert_array_equal(actual, expected)
+            self.assertEqual(actual.dtype, np.int8)
+    
+    def test_matrix_signals_match_per_ticker(self):
+        """Test that multi-ticker matrix signals match running each ticker alone"""
+        close = self.test_data['Close'].to_numpy()
+        matrix = np.column_stack([close, close[::-1], close * 1.5])
+        
+        for strategy in [SmaCrossover(fast=5, slow=10), MA200(window=20, buffer_pct=0.01),
+                         Momentum(lookback=10)]:
+            signals = strategy.generate_signals_matrix(matrix)
+            self.assertEqual(signals.shape, matrix.shape)
+            self.assertEqual(signals.dtype, np.int8)
+            for j in range(matrix.shape[1]):
+                frame = self.test_data.assign(Close=matrix[:, j])
+                np.testing.assert_array_equal(signals[:, j], strategy.generate_signals(frame).to_numpy())
+        
+        np.testing.assert_array_equal(batch_sma_signals(matrix, 5, 10),
+                                      SmaCrossover(fast=5, slow=10).generate_signals_matrix(matrix))
+    
     def test_signal_consistency(self):
         """Test that signals are consistent across strategies"""
         strategies = [
@@ -203,7 +433,7 @@ class TestStrategies(unittest.TestCase):
         ]
         
         for strategy in strategies:
-            signals = strategy.generate_signals(self.test_data)
+            signals = self._get_signals(strategy)
             
             # Check signal length matches data length
             self.assertEqual(len(signals), len(self.test_data))
@@ -212,7 +442,10 @@ class TestStrategies(unittest.TestCase):
             self.assertTrue(signals.index.equals(self.test_data.index))
             
             # Check all signals are valid values
-            self.assertTrue(all(signals.isin([1, -1, 0])))
+            self.assertTrue(_all_signals_valid(signals.to_numpy()))
+            
+            # Signals are stored compactly as int8
+            self.assertEqual(signals.dtype, np.int8)
 
 def run_toy_examples():
     """Run toy examples to demonstrate each strategy"""
@@ -222,15 +455,13 @@ def run_toy_examples():
     
     # Create simple test data
     dates = pd.date_range('2023-01-01', periods=50, freq='D')
-    close_prices = [100 + i + np.random.normal(0, 1) for i in range(50)]
+    rng = np.random.default_rng()
+    close_prices = 100 + np.arange(50) + rng.standard_normal(50)
     
-    test_data = pd.DataFrame({
-        'Open': [p * 0.99 for p in close_prices],
-        'High': [p * 1.02 for p in close_prices],
-        'Low': [p * 0.98 for p in close_prices],
-        'Close': close_prices,
-        'Volume': np.random.randint(1000000, 5000000, 50)
-    }, index=dates)
+    # Open/High/Low/Close as fixed multiples of the close, in one broadcast
+    ohlc = close_prices[:, None] * np.array([0.99, 1.02, 0.98, 1.0])
+    test_data = pd.DataFrame(ohlc, index=dates, columns=['Open', 'High', 'Low', 'Close'])
+    test_data['Volume'] = rng.integers(1000000, 5000000, 50)
     
     # Test each strategy
     strategies = [
@@ -246,8 +477,7 @@ def run_toy_examples():
     
     for name, strategy in strategies:
         signals = strategy.generate_signals(test_data)
-        buy_signals = (signals == 1).sum()
-        sell_signals = (signals == -1).sum()
+        buy_signals, sell_signals = _count_signals(signals)
         
         print(f"{name:20} | Buy: {buy_signals:2d} | Sell: {sell_signals:2d} | Total: {buy_signals + sell_signals:2d}")
     